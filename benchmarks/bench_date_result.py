@@ -0,0 +1,49 @@
+"""Compare memory and build throughput of DateResult and CompactDateResult.
+
+Run from the project root (defaults to 10M results; pass a smaller count
+to extrapolate on small machines):
+    python benchmarks/bench_date_result.py [count]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.calendar_converter import WEEKDAY_NAMES, CompactDateResult, DateResult
+
+
+def eager(i: int) -> DateResult:
+    day, month, year = i % 28 + 1, i % 12 + 1, 1400 + i % 100
+    return DateResult(day, month, year, "", WEEKDAY_NAMES[i % 7],
+                      f"{day}/{month}/{year}")
+
+
+def compact(i: int) -> CompactDateResult:
+    return CompactDateResult(i % 28 + 1, i % 12 + 1, 1400 + i % 100, i % 7)
+
+
+def measure(factory, count: int):
+    """Return (bytes per result, results per second) for ``count`` results."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    results = [factory(i) for i in range(count)]
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return size / count, count / elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    for label, factory in (("DateResult", eager), ("CompactDateResult", compact)):
+        per_item, rate = measure(factory, count)
+        print(f"{label:<18} {per_item:6.0f} B/result  "
+              f"{per_item * 10_000_000 / 2**20:8,.0f} MiB per 10M  {rate:12,.0f} results/s")
+
+
+if __name__ == "__main__":
+    main()
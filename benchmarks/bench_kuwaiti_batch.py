@@ -0,0 +1,59 @@
+"""Check the NumPy Kuwaiti batch path against the scalar one and time both.
+
+Run from the project root:
+    python benchmarks/bench_kuwaiti_batch.py
+"""
+
+import os
+import sys
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from src.core.calendar_converter import KuwaitiCalendarConverter
+
+
+WEEKDAYS = ["Ahad", "Ithnin", "Thulatha", "Arbaa", "Khams", "Jumuah", "Sabt"]
+
+
+def verify(start: date, end: date) -> int:
+    """Compare every day in [start, end] with the scalar path; return days checked."""
+    converter = KuwaitiCalendarConverter()
+    ordinals = np.arange(start.toordinal(), end.toordinal() + 1, dtype=np.int64)
+    batch = converter.convert_to_hijri_batch(ordinals)
+    for i, ordinal in enumerate(ordinals.tolist()):
+        scalar = converter.convert_to_hijri(date.fromordinal(ordinal))
+        got = (int(batch.year[i]), int(batch.month[i]), int(batch.day[i]),
+               WEEKDAYS[batch.weekday[i] - 1])
+        if got != (scalar.year, scalar.month, scalar.day, scalar.weekday):
+            raise AssertionError(f"{date.fromordinal(ordinal)}: batch {got} != scalar {scalar}")
+    return len(ordinals)
+
+
+def main():
+    checked = verify(date(1, 1, 1), date(2200, 12, 31))
+    print(f"Verified {checked:,} days against the scalar path")
+
+    converter = KuwaitiCalendarConverter()
+    sample = [date.fromordinal(o) for o in range(date(1900, 1, 1).toordinal(),
+                                                 date(2100, 1, 1).toordinal())]
+    start = time.perf_counter()
+    for d in sample:
+        converter.convert_to_hijri(d)
+    scalar_rate = len(sample) / (time.perf_counter() - start)
+
+    values = np.arange('1900-01-01', '2100-01-01', dtype='datetime64[D]')
+    values = np.tile(values, 100)
+    start = time.perf_counter()
+    converter.convert_to_hijri_batch(values)
+    batch_rate = len(values) / (time.perf_counter() - start)
+
+    print(f"scalar {scalar_rate:14,.0f} dates/s")
+    print(f"batch  {batch_rate:14,.0f} dates/s  x{batch_rate / scalar_rate:.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Prove the integer Kuwaiti path matches the float path, then time both.
+
+Sweeps every day from 1/1/1 AH to the end of 1600 AH. Run from the
+project root:
+    python benchmarks/bench_kuwaiti_integer.py
+"""
+
+import os
+import sys
+import timeit
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.calendar_converter import KuwaitiCalendarConverter
+
+
+def sweep(first_year: int = 1, last_year: int = 1600) -> int:
+    """Compare both paths over the Hijri year span; return days checked."""
+    float_path = KuwaitiCalendarConverter()
+    int_path = KuwaitiCalendarConverter(integer_math=True)
+
+    # Start a little before 1 AH and stop once the float path passes the span.
+    ordinal = date(622, 7, 1).toordinal()
+    checked = 0
+    while True:
+        d = date.fromordinal(ordinal)
+        expected = float_path.convert_to_hijri(d)
+        if expected.year > last_year:
+            break
+        if expected.year >= first_year:
+            actual = int_path.convert_to_hijri(d)
+            if actual != expected:
+                raise AssertionError(f"{d}: integer {actual} != float {expected}")
+            checked += 1
+        ordinal += 1
+    return checked
+
+
+def main():
+    checked = sweep()
+    print(f"Integer path matches float path on all {checked:,} days of 1-1600 AH")
+
+    sample = date(2024, 3, 11)
+    number = 200_000
+    for label, converter in (("float", KuwaitiCalendarConverter()),
+                             ("integer", KuwaitiCalendarConverter(integer_math=True))):
+        seconds = timeit.timeit(lambda: converter.convert_to_hijri(sample), number=number)
+        print(f"{label:<8} {seconds / number * 1e9:8.0f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Check the month-start index against hijridate and compare throughput.
+
+Per-call rows time ``to_hijri``/``to_gregorian`` returning full
+``DateResult`` objects; bulk rows time ``to_hijri_many``/``to_gregorian_many``
+yielding ``CompactDateResult`` objects; "ordinals only" rows time the
+index's list APIs, which build no result objects at all. Ratios are
+against the hijridate-backed converter doing the same per-call or bulk job.
+
+Run from the project root:
+    python benchmarks/bench_month_index.py
+"""
+
+import os
+import sys
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hijridate import Gregorian, Hijri
+
+from src.core.calendar_converter import HijriGregorianConverter
+from src.core.month_index import get_month_index
+
+
+def verify_full_range() -> int:
+    """Compare every supported day in both directions; return days checked."""
+    index = get_month_index()
+    checked = 0
+    for ordinal in range(index.min_ordinal, index.max_ordinal + 1):
+        g = date.fromordinal(ordinal)
+        expected = Gregorian(g.year, g.month, g.day).to_hijri().datetuple()
+        actual = index.to_hijri(g.year, g.month, g.day)
+        if actual != expected:
+            raise AssertionError(f"{g}: index {actual} != hijridate {expected}")
+        back = index.to_gregorian(*actual)
+        if back != Hijri(*expected).to_gregorian().datetuple():
+            raise AssertionError(f"{expected}: index {back} != hijridate")
+        checked += 1
+    return checked
+
+
+def _rate(func, count: int, repeat: int = 3) -> float:
+    """Return the best conversions per second of ``func()`` over ``repeat`` runs."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return count / best
+
+
+def _report(label: str, baseline: float, indexed: float):
+    print(f"{label:<36} hijridate {baseline:12,.0f}/s  index {indexed:12,.0f}/s  "
+          f"x{indexed / baseline:.1f}")
+
+
+def main():
+    checked = verify_full_range()
+    print(f"Verified {checked} days against hijridate")
+
+    index = get_month_index()
+    ordinals = list(range(index.min_ordinal, index.max_ordinal + 1))
+    gregorian = [date.fromordinal(o).timetuple()[:3] for o in ordinals]
+    hijri = index.hijri_from_ordinals(ordinals)
+    count = len(ordinals)
+
+    plain = HijriGregorianConverter()
+    fast = HijriGregorianConverter(use_index=True)
+
+    def loop(convert, dates):
+        return lambda: [convert(d, m, y) for y, m, d in dates]
+
+    def many(convert, dates):
+        rows = [(d, m, y) for y, m, d in dates]
+        return lambda: list(convert(rows))
+
+    baseline = _rate(loop(plain.to_hijri, gregorian), count)
+    _report("to_hijri (per call)", baseline, _rate(loop(fast.to_hijri, gregorian), count))
+    baseline = _rate(many(plain.to_hijri_many, gregorian), count)
+    _report("to_hijri_many (bulk)", baseline, _rate(many(fast.to_hijri_many, gregorian), count))
+    _report("hijri_from_ordinals (ordinals only)", baseline,
+            _rate(lambda: index.hijri_from_ordinals(ordinals), count))
+
+    count = len(hijri)
+    baseline = _rate(loop(plain.to_gregorian, hijri), count)
+    _report("to_gregorian (per call)", baseline, _rate(loop(fast.to_gregorian, hijri), count))
+    baseline = _rate(many(plain.to_gregorian_many, hijri), count)
+    _report("to_gregorian_many (bulk)", baseline,
+            _rate(many(fast.to_gregorian_many, hijri), count))
+    _report("ordinals_from_hijri (ordinals only)", baseline,
+            _rate(lambda: index.ordinals_from_hijri(hijri), count))
+
+if __name__ == "__main__":
+    main()
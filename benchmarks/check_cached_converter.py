@@ -0,0 +1,58 @@
+"""Check that single and bulk calls on one cache keep their result types.
+
+``to_hijri``/``to_gregorian`` return ``DateResult`` and the ``*_many``
+methods yield ``CompactDateResult``; mixing them on one shared cache must
+not hand one kind to the other. Exits 1 on a mismatch.
+
+Run from the project root:
+    python benchmarks/check_cached_converter.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.cache import ConversionCache
+from src.core.calendar_converter import (
+    CachedConverter, CompactDateResult, DateResult, HijriGregorianConverter,
+)
+
+
+GREGORIAN = (11, 3, 2024)
+HIJRI = (1, 9, 1445)
+
+
+def check(bulk_first: bool) -> list:
+    """Mix single and bulk calls on a fresh cache; return the failures."""
+    cached = CachedConverter(HijriGregorianConverter(use_index=True), ConversionCache(64))
+    calls = [
+        ("to_hijri", lambda: cached.to_hijri(*GREGORIAN), DateResult),
+        ("to_hijri_many", lambda: next(cached.to_hijri_many([GREGORIAN])), CompactDateResult),
+        ("to_gregorian", lambda: cached.to_gregorian(*HIJRI), DateResult),
+        ("to_gregorian_many", lambda: next(cached.to_gregorian_many([HIJRI])),
+         CompactDateResult),
+    ]
+    if bulk_first:
+        calls = calls[1::-1] + calls[:1:-1]
+
+    failures = []
+    for name, call, expected in calls + calls:  # the second pass hits the cache
+        result = call()
+        if type(result) is not expected:
+            failures.append(f"{name} returned {type(result).__name__} "
+                            f"(bulk first: {bulk_first})")
+    return failures
+
+
+def main() -> int:
+    failures = check(bulk_first=False) + check(bulk_first=True)
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    if not failures:
+        print("Single and bulk results keep their types on a shared cache")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""Check import-time budgets for the non-GUI entry points.
+
+Each target is imported in a fresh interpreter with ``-X importtime``; the
+best cumulative time over several runs must stay within its budget, and
+none of the heavy optional modules may be pulled in. Exits 1 when a check
+fails, so it can run in CI.
+
+Run from the project root:
+    python benchmarks/check_import_time.py
+    python benchmarks/check_import_time.py --scale 2   # slower machines
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Set, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Best-of-runs cumulative import time allowed per module, in milliseconds:
+# about 1.5x what each took on Python 3.11 when the budgets were set, so
+# a new eager dependency or module-level table pushes it over. Importing
+# src.core alone runs an empty __init__, so the budgets name the modules
+# that load code.
+BUDGETS_MS: Dict[str, float] = {
+    "src.core.calendar_converter": 90,
+    "src.core.text_io": 95,
+    "src.localization.translations": 60,
+    "src.localization.formatters": 60,
+    "src.localization.date_parser": 65,
+    "src.daemon_client": 30,
+    "src.cli": 100,
+}
+
+# Loaded on demand only: the GUI toolkits, hijridate's object API and the
+# batch/dataframe extras
+FORBIDDEN = ("hijridate", "pyglet", "tkinter", "numpy", "pandas", "pyarrow")
+
+
+def import_time(module: str) -> Tuple[float, Set[str]]:
+    """Import ``module`` in a new interpreter; return (ms, top-level modules loaded)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    cumulative = None
+    loaded = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, total, name = line.split("|")
+        name = name.strip()
+        loaded.add(name.split(".")[0])
+        if name == module:
+            cumulative = int(total) / 1000
+    if cumulative is None:
+        raise RuntimeError(f"{module} did not appear in the -X importtime output")
+    return cumulative, loaded
+
+
+def check(module: str, budget: float, runs: int) -> List[str]:
+    """Return the failures for one module (empty when it is within budget)."""
+    best = float("inf")
+    loaded: Set[str] = set()
+    for _ in range(runs):
+        ms, loaded = import_time(module)
+        best = min(best, ms)
+    heavy = sorted(loaded.intersection(FORBIDDEN))
+    status = "ok" if best <= budget and not heavy else "FAIL"
+    print(f"{module:<30} {best:8.1f} ms  (budget {budget:.0f} ms)  {status}"
+          + (f"  imports {', '.join(heavy)}" if heavy else ""))
+
+    failures = []
+    if best > budget:
+        failures.append(f"{module} took {best:.1f} ms, over its {budget:.0f} ms budget")
+    if heavy:
+        failures.append(f"{module} imports {', '.join(heavy)}")
+    return failures
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="imports per module (best is kept)")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every budget")
+    parser.add_argument("--budget-ms", type=float,
+                        help="budget for modules without one of their own")
+    parser.add_argument("module", nargs="*", help="modules to check (default: all budgeted)")
+    args = parser.parse_args(argv)
+
+    unbudgeted = [m for m in args.module if m not in BUDGETS_MS]
+    if unbudgeted and args.budget_ms is None:
+        parser.error(f"no budget for {', '.join(unbudgeted)}; pass --budget-ms")
+
+    failures = []
+    for module in args.module or BUDGETS_MS:
+        budget = BUDGETS_MS.get(module, args.budget_ms) * args.scale
+        failures += check(module, budget, args.runs)
+
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""Check ``KuwaitiCalendarConverter(true_jdn=True)`` over 1900-2100.
+
+This is the converter behind ``--algorithm kuwaiti``.
+
+Every day must get a real Hijri date (no day 0 or month 0), consecutive
+days must step by one Hijri day, weekdays must match, and every label the
+Kuwaiti calendar gives directly must be kept. Exits 1 on a failure.
+
+Run from the project root:
+    python benchmarks/check_kuwaiti_bulk.py
+"""
+
+import os
+import sys
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.calendar_converter import KuwaitiCalendarConverter
+from src.core.calendars import GREGORIAN, KUWAITI
+
+
+KNOWN = {date(2024, 3, 11): (1445, 9, 1)}
+
+
+def follows(previous, current) -> bool:
+    """Whether ``current`` is the Hijri day after ``previous``."""
+    (py, pm, pd), (cy, cm, cd) = previous, current
+    if (cy, cm) == (py, pm):
+        return cd == pd + 1
+    next_month = (py + 1, 1) if pm == 12 else (py, pm + 1)
+    return (cy, cm) == next_month and cd == 1 and pd >= 29
+
+
+def check(start: date, end: date) -> list:
+    """Return the failures over ``start``..``end`` inclusive."""
+    converter = KuwaitiCalendarConverter(true_jdn=True)
+    failures = []
+    previous = None
+    for ordinal in range(start.toordinal(), end.toordinal() + 1):
+        day = date.fromordinal(ordinal)
+        result = converter.to_hijri(day.day, day.month, day.year)
+        hijri = (result.year, result.month, result.day)
+
+        if not (1 <= result.month <= 12 and 1 <= result.day <= 30):
+            failures.append(f"{day}: impossible date {hijri}")
+        if previous is not None and not follows(previous, hijri):
+            failures.append(f"{day}: {hijri} does not follow {previous}")
+        if day in KNOWN and hijri != KNOWN[day]:
+            failures.append(f"{day}: {hijri}, expected {KNOWN[day]}")
+        direct = KUWAITI.from_jdn(GREGORIAN.to_jdn(day.year, day.month, day.day))
+        if direct[1] and direct[2] and direct != hijri:
+            failures.append(f"{day}: {hijri}, Kuwaiti calendar gives {direct}")
+        weekday = KuwaitiCalendarConverter.WEEKDAY_NAMES[(day.weekday() + 1) % 7]
+        if result.weekday != weekday:
+            failures.append(f"{day}: weekday {result.weekday}, expected {weekday}")
+        previous = hijri
+    return failures
+
+
+def main() -> int:
+    start, end = date(1900, 1, 1), date(2100, 12, 31)
+    failures = check(start, end)
+    for failure in failures[:20]:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    if failures:
+        print(f"{len(failures)} failures", file=sys.stderr)
+        return 1
+    print(f"Checked {end.toordinal() - start.toordinal() + 1} days from {start} to {end}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""Check ``convert_parquet`` output files, including inputs without rows.
+
+Writes small Parquet inputs to a temporary directory, converts them in
+both column layouts, and compares the result with the month-start index.
+Exits 1 on a failure. Requires pyarrow.
+
+Run from the project root:
+    python benchmarks/check_parquet_pipeline.py
+"""
+
+import os
+import sys
+import tempfile
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.arrow_pipeline import convert_parquet
+from src.core.month_index import get_month_index
+
+
+EXPECTED_NAMES = {
+    False: ["posted", "amount", "posted_hijri_year", "posted_hijri_month", "posted_hijri_day"],
+    True: ["posted", "amount", "posted_hijri"],
+}
+
+
+def check(directory: str, rows: int, struct: bool) -> list:
+    """Convert a ``rows``-row input; return the failures."""
+    label = f"{rows} rows, struct={struct}"
+    start = date(2024, 3, 1)
+    dates = [start + timedelta(days=i) for i in range(rows)]
+    schema = pa.schema([pa.field("posted", pa.date32(), nullable=False),
+                        pa.field("amount", pa.int64())])
+    source = os.path.join(directory, f"in_{rows}_{struct}.parquet")
+    target = os.path.join(directory, f"out_{rows}_{struct}.parquet")
+    pq.write_table(pa.table({"posted": dates, "amount": list(range(rows))}, schema=schema),
+                   source)
+
+    written, failed = convert_parquet(source, target, ["posted"], struct=struct)
+    if not os.path.exists(target):
+        return [f"{label}: no output file written"]
+    table = pq.read_table(target)
+
+    failures = []
+    if (written, failed) != (rows, 0) or table.num_rows != rows:
+        failures.append(f"{label}: returned ({written}, {failed}), file has {table.num_rows} rows")
+    if table.schema.names != EXPECTED_NAMES[struct]:
+        failures.append(f"{label}: columns {table.schema.names}")
+    index = get_month_index()
+    for day, record in zip(dates, table.to_pylist()):
+        if struct:
+            hijri = tuple(record["posted_hijri"].values())
+        else:
+            hijri = (record["posted_hijri_year"], record["posted_hijri_month"],
+                     record["posted_hijri_day"])
+        if hijri != index.to_hijri(day.year, day.month, day.day):
+            failures.append(f"{label}: {day} converted to {hijri}")
+    return failures
+
+
+def main() -> int:
+    failures = []
+    with tempfile.TemporaryDirectory() as directory:
+        for rows in (0, 40):
+            for struct in (False, True):
+                failures += check(directory, rows, struct)
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    if not failures:
+        print("Parquet conversion writes complete files, including empty inputs")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
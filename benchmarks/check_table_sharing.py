@@ -0,0 +1,61 @@
+"""Check that converters built on a table file keep no copy of the table.
+
+Builds a table file, maps it once, then measures with ``tracemalloc`` what
+each further ``HijriGregorianConverter(table_path=...)`` allocates. The
+month starts must stay in the mapped file, so a converter (with its
+validators and calendar) has to cost well under one copy of the table.
+Exits 1 on a failure.
+
+Run from the project root:
+    python benchmarks/check_table_sharing.py
+"""
+
+import os
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.calendar_converter import HijriGregorianConverter
+from src.core.table_file import build_table, load_table
+
+
+CONVERTERS = 20
+
+
+def main() -> int:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "calendar.tbl")
+        build_table(path)
+        index = load_table(path)
+        table_bytes = len(index.starts) * 4
+
+        failures = []
+        if not isinstance(index.starts, memoryview):
+            failures.append(f"index starts are a {type(index.starts).__name__}, not the mapping")
+
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        converters = [HijriGregorianConverter(table_path=path) for _ in range(CONVERTERS)]
+        per_converter = (tracemalloc.get_traced_memory()[0] - before) / CONVERTERS
+        tracemalloc.stop()
+
+        converters[0].to_hijri(11, 3, 2024)
+        if any(converter._index is not index for converter in converters):
+            failures.append("converters do not share the loaded index")
+        if per_converter > table_bytes / 4:
+            failures.append(f"each converter allocates {per_converter:,.0f} bytes; "
+                            f"the table is {table_bytes:,} bytes")
+        del converters, index
+
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    if not failures:
+        print(f"Each converter allocates {per_converter:,.0f} bytes "
+              f"over a {table_bytes:,}-byte mapped table")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
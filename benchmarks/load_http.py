@@ -0,0 +1,81 @@
+"""Load generator for the HTTP conversion service.
+
+Opens keep-alive connections and reports requests/sec with p50/p99
+latency. Start the server first, then run from the project root:
+    hijri-converter serve --port 8080 &
+    python benchmarks/load_http.py --port 8080 --connections 32 --requests 20000
+    python benchmarks/load_http.py --port 8080 --batch 1000 --requests 200
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from datetime import date
+
+
+def _request(host: str, path: str, payload: dict) -> bytes:
+    body = json.dumps(payload).encode()
+    return (f"POST {path} HTTP/1.1\r\nHost: {host}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+            ).encode() + body
+
+
+def _random_date() -> str:
+    return date.fromordinal(random.randint(702574, 758564)).isoformat()
+
+
+async def _client(host: str, port: int, count: int, batch: int, latencies: list):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(count):
+            if batch:
+                payload = _request(host, "/convert/batch",
+                                   {"to": "hijri", "dates": [_random_date() for _ in range(batch)]})
+            else:
+                payload = _request(host, "/convert", {"to": "hijri", "date": _random_date()})
+            start = time.perf_counter()
+            writer.write(payload)
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = next(int(line.split(b":")[1]) for line in head.split(b"\r\n")
+                          if line.lower().startswith(b"content-length"))
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+            if not head.startswith(b"HTTP/1.1 200"):
+                raise RuntimeError(head.split(b"\r\n")[0].decode())
+    finally:
+        writer.close()
+
+
+async def run(host: str, port: int, connections: int, requests: int, batch: int):
+    latencies: list = []
+    per_client = max(1, requests // connections)
+    start = time.perf_counter()
+    await asyncio.gather(*(_client(host, port, per_client, batch, latencies)
+                           for _ in range(connections)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+    kind = f"batch of {batch}" if batch else "single"
+    print(f"{len(latencies)} {kind} requests over {connections} connections in {elapsed:.2f}s")
+    print(f"{len(latencies) / elapsed:,.0f} req/s  p50 {p50:.2f} ms  p99 {p99:.2f} ms")
+    if batch:
+        print(f"{len(latencies) * batch / elapsed:,.0f} dates/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--connections", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=10000)
+    parser.add_argument("--batch", type=int, default=0,
+                        help="dates per batch request; 0 sends single conversions")
+    args = parser.parse_args()
+    asyncio.run(run(args.host, args.port, args.connections, args.requests, args.batch))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,9 @@
 """Main entry point for the Hijri Date Converter application."""
 
+import time
+
+_STARTED = time.perf_counter()
+
 import sys
 import os
 import logging
@@ -7,12 +11,19 @@ import logging
 # Add src directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.ui.main_window import DateConverterUI
 from src.utils.logger import setup_logging
 
 
 def main():
-    """Main application entry point."""
+    """Main application entry point.
+    
+    With a subcommand (e.g. ``convert``) the headless CLI runs without
+    importing any GUI toolkit; otherwise the desktop application starts.
+    """
+    if len(sys.argv) > 1:
+        from src.cli import main as cli_main
+        sys.exit(cli_main(sys.argv[1:]))
+    
     # Setup logging
     setup_logging(log_level="INFO", log_file="logs/app.log")
     logger = logging.getLogger(__name__)
@@ -21,7 +32,11 @@ def main():
         logger.info("Starting Hijri Date Converter application")
         
         # Create and run the application
-        app = DateConverterUI()
+        from src.utils.timing import StartupTimer
+        timer = StartupTimer(_STARTED)
+        from src.ui.main_window import DateConverterUI
+        timer.mark("imports")
+        app = DateConverterUI(timer)
         app.run()
         
     except Exception as e:
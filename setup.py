@@ -46,9 +46,15 @@ setup(
     ],
     python_requires=">=3.7",
     install_requires=read_requirements(),
+    extras_require={
+        "batch": ["numpy>=1.20"],
+        "pandas": ["numpy>=1.20", "pandas>=1.3"],
+        "arrow": ["numpy>=1.20", "pyarrow>=8.0"],
+    },
     include_package_data=True,
     package_data={
         "": ["fonts/*.ttf", "images/*.png", "images/*.ico"],
+        "src.localization": ["catalogs/*.json"],
     },
     entry_points={
         "console_scripts": [
@@ -0,0 +1,111 @@
+"""Columnar Hijri conversion for Arrow record batches and Parquet files.
+
+Arrow ``date32`` columns are converted batch by batch with the NumPy
+Umm al-Qura kernel, so no per-row Python objects are created and memory
+is bounded by the batch size. Requires pyarrow (``pip install .[arrow]``).
+
+Example:
+    hijri-converter parquet --in ledger.parquet --out ledger_hijri.parquet --col posted
+"""
+
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .core.month_index import MonthStartIndex, get_month_index
+from .core.vectorized import ORDINAL_EPOCH_OFFSET, ummalqura_from_ordinals
+
+
+HIJRI_FIELDS = (("year", pa.int16()), ("month", pa.int8()), ("day", pa.int8()))
+
+
+def hijri_arrays(column: pa.Array, index: Optional[MonthStartIndex] = None
+                 ) -> Tuple[pa.Array, pa.Array, pa.Array]:
+    """Convert a ``date32`` array to Hijri year, month and day arrays.
+
+    Nulls and dates outside the supported range become nulls.
+    """
+    index = index if index is not None else get_month_index()
+    if isinstance(column, pa.ChunkedArray):
+        column = column.combine_chunks()
+    if not pa.types.is_date32(column.type):
+        column = column.cast(pa.date32())
+    days = column.fill_null(0).cast(pa.int32()).to_numpy()
+    ordinals = days.astype(np.int64) + ORDINAL_EPOCH_OFFSET
+    year, month, day, valid = ummalqura_from_ordinals(ordinals, index)
+    missing = ~valid | column.is_null().to_numpy(zero_copy_only=False)
+    return tuple(pa.array(values.astype(arrow_type.to_pandas_dtype()), type=arrow_type,
+                          mask=missing)
+                 for values, (_, arrow_type) in zip((year, month, day), HIJRI_FIELDS))
+
+
+def output_schema(schema: pa.Schema, columns: Iterable[str], struct: bool = False) -> pa.Schema:
+    """Return ``schema`` with the Hijri fields ``convert_batch`` appends."""
+    for name in columns:
+        if struct:
+            schema = schema.append(pa.field(
+                f"{name}_hijri", pa.struct([pa.field(f, t) for f, t in HIJRI_FIELDS])))
+        else:
+            for field, arrow_type in HIJRI_FIELDS:
+                schema = schema.append(pa.field(f"{name}_hijri_{field}", arrow_type))
+    return schema
+
+
+def convert_batch(batch: pa.RecordBatch, columns: Iterable[str], struct: bool = False,
+                  index: Optional[MonthStartIndex] = None) -> pa.RecordBatch:
+    """Append Hijri columns for each named ``date32`` column of a batch.
+
+    Adds ``<col>_hijri_year``/``_month``/``_day`` columns, or a single
+    ``<col>_hijri`` struct column when ``struct`` is True.
+    """
+    columns = list(columns)
+    arrays: List[pa.Array] = list(batch.columns)
+    for name in columns:
+        parts = hijri_arrays(batch.column(name), index)
+        if struct:
+            arrays.append(pa.StructArray.from_arrays(
+                parts, fields=[pa.field(f, t) for f, t in HIJRI_FIELDS],
+                mask=parts[0].is_null()))
+        else:
+            arrays.extend(parts)
+    return pa.RecordBatch.from_arrays(arrays, schema=output_schema(batch.schema, columns, struct))
+
+
+def convert_batches(batches: Iterable[pa.RecordBatch], columns: List[str],
+                    struct: bool = False,
+                    index: Optional[MonthStartIndex] = None) -> Iterator[pa.RecordBatch]:
+    """Lazily convert a stream of record batches."""
+    index = index if index is not None else get_month_index()
+    for batch in batches:
+        yield convert_batch(batch, columns, struct, index)
+
+
+def convert_parquet(in_path: str, out_path: str, columns: List[str],
+                    batch_size: int = 65536, struct: bool = False,
+                    compression: str = "snappy") -> Tuple[int, int]:
+    """Read a Parquet file batch by batch, add Hijri columns, and write it out.
+
+    Returns:
+        (rows written, non-null dates outside the supported range)
+    """
+    source = pq.ParquetFile(in_path)
+    names = source.schema_arrow.names
+    missing = [name for name in columns if name not in names]
+    if missing:
+        raise ValueError(f"Columns {missing} not found in {in_path}: {names}")
+
+    index = get_month_index()
+    rows = failed = 0
+    # Created up front so an input without rows still gets an (empty) output file
+    with pq.ParquetWriter(out_path, output_schema(source.schema_arrow, columns, struct),
+                          compression=compression) as writer:
+        for batch in source.iter_batches(batch_size=batch_size):
+            out = convert_batch(batch, columns, struct, index)
+            writer.write_batch(out)
+            rows += out.num_rows
+            for name in columns:
+                converted = out.column(f"{name}_hijri" if struct else f"{name}_hijri_year")
+                failed += converted.null_count - batch.column(name).null_count
+    return rows, failed
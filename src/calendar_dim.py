@@ -0,0 +1,201 @@
+"""Streaming calendar dimension generator for data warehouses.
+
+Produces one row per Gregorian day with Hijri year/month/day, month
+lengths, weekday and month names in every language. Only the first
+supported day of the range is converted; later days are reached by
+stepping (see ``iter_date_range``). Days outside the supported Hijri
+range keep their Gregorian columns and get empty Hijri columns.
+
+The range is cut into chunks of ``chunk_days`` that are rendered one at a
+time, or by a process pool, and written in order, so memory stays bounded
+by the chunk size.
+
+Example:
+    hijri-converter dimension --start 1900-01-01 --end 2100-12-31 \\
+        --format parquet --out date_dim.parquet --workers 4
+"""
+
+from datetime import date, timedelta
+from multiprocessing import Pool
+from typing import Any, Iterator, List, Optional, TextIO, Tuple
+import calendar
+import csv
+import io
+import json
+
+from .config.settings import Language
+from .core.calendar_converter import iter_date_range
+from .core.month_index import MonthStartIndex, get_month_index
+from .localization.translations import WEEKDAY_ORDER, TranslationData
+
+
+FORMATS = ("csv", "jsonl", "parquet")
+
+COLUMNS: Tuple[str, ...] = (
+    "date", "year", "month", "day", "day_of_year", "weekday", "month_length",
+    *(f"month_name_{lang.value}" for lang in Language),
+    *(f"weekday_name_{lang.value}" for lang in Language),
+    "hijri_year", "hijri_month", "hijri_day", "hijri_month_length",
+    *(f"hijri_month_name_{lang.value}" for lang in Language),
+)
+
+_GREGORIAN_NAMES = tuple(zip(*(TranslationData.GREGORIAN_MONTHS[lang] for lang in Language)))
+_HIJRI_NAMES = tuple(zip(*(TranslationData.HIJRI_MONTHS[lang] for lang in Language)))
+_WEEKDAY_NAMES = tuple(tuple(TranslationData.WEEKDAYS[lang][name] for lang in Language)
+                       for name in WEEKDAY_ORDER)
+_NO_HIJRI = (None,) * (4 + len(Language))
+
+
+def iter_days(start: date, end: date, index: Optional[MonthStartIndex] = None
+              ) -> Iterator[Tuple[date, int, Optional[Tuple[int, int, int]], Optional[int]]]:
+    """Yield (gregorian, weekday, hijri, hijri_month_length) for every day.
+
+    ``hijri`` is a (year, month, day) tuple, or None (as is the month
+    length) outside the supported range.
+    """
+    index = index if index is not None else get_month_index()
+    first, last = start.toordinal(), end.toordinal()
+    low, high = max(first, index.min_ordinal), min(last, index.max_ordinal)
+
+    for ordinal in range(first, min(last, low - 1) + 1):
+        gregorian = date.fromordinal(ordinal)
+        yield gregorian, gregorian.weekday(), None, None
+    if low <= high:
+        month_length = None
+        for day in iter_date_range(date.fromordinal(low), date.fromordinal(high), index=index):
+            if day.hijri[2] == 1 or month_length is None:
+                month_length = index.month_length(day.hijri[0], day.hijri[1])
+            yield day.gregorian, day.weekday, day.hijri, month_length
+    for ordinal in range(max(first, high + 1), last + 1):
+        gregorian = date.fromordinal(ordinal)
+        yield gregorian, gregorian.weekday(), None, None
+
+
+def dimension_rows(start: date, end: date,
+                   index: Optional[MonthStartIndex] = None) -> Iterator[tuple]:
+    """Yield one row per day, with values in ``COLUMNS`` order."""
+    year_start = month_length = None
+    for gregorian, weekday, hijri, hijri_month_length in iter_days(start, end, index):
+        year, month, day = gregorian.year, gregorian.month, gregorian.day
+        if year_start is None or (month == 1 and day == 1):
+            year_start = date(year, 1, 1).toordinal()
+        if month_length is None or day == 1:
+            month_length = calendar.monthrange(year, month)[1]
+        row = (gregorian.isoformat(), year, month, day,
+               gregorian.toordinal() - year_start + 1, weekday, month_length,
+               *_GREGORIAN_NAMES[month - 1], *_WEEKDAY_NAMES[weekday])
+        if hijri is None:
+            yield row + _NO_HIJRI
+        else:
+            yield row + (*hijri, hijri_month_length, *_HIJRI_NAMES[hijri[1] - 1])
+
+
+def split_range(start: date, end: date, chunk_days: int) -> List[Tuple[date, date]]:
+    """Cut ``start``..``end`` (inclusive) into consecutive chunks."""
+    chunks = []
+    while start <= end:
+        chunk_end = min(start + timedelta(days=chunk_days - 1), end)
+        chunks.append((start, chunk_end))
+        start = chunk_end + timedelta(days=1)
+    return chunks
+
+
+def _arrow_schema():
+    """Parquet schema for ``COLUMNS``."""
+    import pyarrow as pa
+
+    names = len(Language)
+    types = ([pa.string()] + [pa.int16(), pa.int8(), pa.int8(), pa.int16(), pa.int8(),
+                              pa.int8()] + [pa.string()] * (2 * names)
+             + [pa.int16(), pa.int8(), pa.int8(), pa.int8()] + [pa.string()] * names)
+    return pa.schema(list(zip(COLUMNS, types)))
+
+
+def _render(chunk: Tuple[date, date], fmt: str,
+            index: Optional[MonthStartIndex] = None) -> Tuple[Any, int]:
+    """Render one chunk as CSV text, JSON lines or an Arrow record batch."""
+    rows = list(dimension_rows(*chunk, index=index))
+    if fmt == "csv":
+        out = io.StringIO(newline="")
+        csv.writer(out, lineterminator="\n").writerows(rows)
+        return out.getvalue(), len(rows)
+    if fmt == "jsonl":
+        return "".join(json.dumps(dict(zip(COLUMNS, row)), ensure_ascii=False) + "\n"
+                       for row in rows), len(rows)
+
+    import pyarrow as pa
+
+    schema = _arrow_schema()
+    columns = [pa.array(values, type=field.type)
+               for values, field in zip(zip(*rows), schema)]
+    return pa.RecordBatch.from_arrays(columns, schema=schema), len(rows)
+
+
+def _render_task(task: Tuple[Tuple[date, date], str]) -> Tuple[Any, int]:
+    """Pool entry point; each worker uses its own shared month index."""
+    return _render(*task)
+
+
+def generate_dimension(out: str, start: date = date(1900, 1, 1),
+                       end: date = date(2100, 12, 31), fmt: str = "csv",
+                       workers: Optional[int] = None, chunk_days: int = 366,
+                       stream: Optional[TextIO] = None) -> int:
+    """Write the calendar dimension for ``start``..``end`` inclusive.
+
+    Args:
+        out: Output path; ignored for CSV/JSON lines when ``stream`` is given.
+        fmt: ``"csv"``, ``"jsonl"`` or ``"parquet"`` (requires pyarrow).
+        workers: Render chunks in this many processes; None renders in
+            this process, 0 uses one per CPU.
+        chunk_days: Days rendered per chunk.
+        stream: Text stream for CSV/JSON lines output, e.g. stdout.
+
+    Returns:
+        Number of rows written.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format {fmt!r}; expected one of {FORMATS}")
+    if end < start:
+        raise ValueError(f"End date {end} is before start date {start}")
+    if chunk_days < 1:
+        raise ValueError("chunk_days must be at least 1")
+
+    tasks = [(chunk, fmt) for chunk in split_range(start, end, chunk_days)]
+    pool = Pool(workers or None) if workers is not None else None
+    try:
+        parts = (pool.imap(_render_task, tasks) if pool is not None
+                 else (_render_task(task) for task in tasks))
+        if fmt == "parquet":
+            return _write_parquet(out, parts)
+        return _write_text(out, fmt, parts, stream)
+    finally:
+        if pool is not None:
+            pool.terminate()
+
+
+def _write_text(out: str, fmt: str, parts, stream: Optional[TextIO]) -> int:
+    """Write rendered CSV/JSON lines chunks in order."""
+    target = stream if stream is not None else open(out, "w", encoding="utf-8", newline="")
+    written = 0
+    try:
+        if fmt == "csv":
+            csv.writer(target, lineterminator="\n").writerow(COLUMNS)
+        for text, rows in parts:
+            target.write(text)
+            written += rows
+    finally:
+        if target is not stream:
+            target.close()
+    return written
+
+
+def _write_parquet(out: str, parts) -> int:
+    """Write rendered record batches to one Parquet file."""
+    import pyarrow.parquet as pq
+
+    written = 0
+    with pq.ParquetWriter(out, _arrow_schema()) as writer:
+        for batch, rows in parts:
+            writer.write_batch(batch)
+            written += rows
+    return written
@@ -0,0 +1,242 @@
+"""Headless command-line interface.
+
+Only the core converters are imported here, never tkinter or pyglet, so
+the commands work on servers and in batch pipelines.
+
+Examples:
+    hijri-converter convert --in dates.csv --col due_date --to hijri
+    cat dates.csv | hijri-converter convert --col due_date --to gregorian > out.csv
+    hijri-converter serve --port 8080
+    hijri-converter daemon --socket /tmp/hijri-converter.sock
+"""
+
+from datetime import date
+from typing import List, Optional, TextIO
+import argparse
+import logging
+import sys
+import time
+
+from .config.settings import CalendarType
+from .core.calendar_converter import (
+    ErrorPolicy, HijriGregorianConverter, KuwaitiCalendarConverter,
+)
+from .core.text_io import convert_stream
+from .daemon_client import DEFAULT_SOCKET
+
+
+logger = logging.getLogger(__name__)
+
+
+def _open(path: Optional[str], mode: str, default: TextIO) -> TextIO:
+    """Open ``path``, or return ``default`` for None or '-'."""
+    if path is None or path == '-':
+        return default
+    return open(path, mode, encoding='utf-8', newline='')
+
+
+def _cmd_convert(args) -> int:
+    """Run the ``convert`` subcommand."""
+    if args.algorithm == "kuwaiti" and args.to != CalendarType.HIJRI.value:
+        raise ValueError("The Kuwaiti algorithm only converts Gregorian to Hijri")
+    if args.workers is not None:
+        return _cmd_convert_parallel(args)
+    if args.algorithm == "kuwaiti":
+        converter = KuwaitiCalendarConverter(true_jdn=True)
+    else:
+        converter = HijriGregorianConverter(use_index=args.table is None,
+                                            table_path=args.table)
+    infile = _open(args.infile, 'r', sys.stdin)
+    outfile = _open(args.outfile, 'w', sys.stdout)
+    start = time.perf_counter()
+    try:
+        written, failed = convert_stream(
+            infile, outfile, args.col, CalendarType(args.to),
+            out_column=args.out_col, chunk_size=args.chunk_size,
+            on_error=ErrorPolicy(args.on_error), delimiter=args.delimiter,
+            converter=converter,
+        )
+    finally:
+        if infile is not sys.stdin:
+            infile.close()
+        if outfile is not sys.stdout:
+            outfile.close()
+    _report(written, failed, time.perf_counter() - start)
+    return 0
+
+
+def _cmd_convert_parallel(args) -> int:
+    """Run ``convert`` over byte-range chunks in a process pool."""
+    from .parallel import convert_file_parallel
+    
+    if args.infile is None or args.infile == '-':
+        raise ValueError("--workers needs a seekable --in file, not stdin")
+    outfile = _open(args.outfile, 'w', sys.stdout)
+    start = time.perf_counter()
+    try:
+        written, failed = convert_file_parallel(
+            args.infile, outfile, args.col, CalendarType(args.to),
+            workers=args.workers or None, chunk_bytes=args.chunk_mb * 2**20,
+            algorithm=args.algorithm, table_path=args.table,
+            out_column=args.out_col, on_error=ErrorPolicy(args.on_error),
+            delimiter=args.delimiter,
+        )
+    finally:
+        if outfile is not sys.stdout:
+            outfile.close()
+    _report(written, failed, time.perf_counter() - start)
+    return 0
+
+
+def _cmd_parquet(args) -> int:
+    """Run the ``parquet`` subcommand."""
+    from .arrow_pipeline import convert_parquet
+    
+    start = time.perf_counter()
+    written, failed = convert_parquet(args.infile, args.outfile, args.col,
+                                      batch_size=args.batch_size, struct=args.struct)
+    _report(written, failed, time.perf_counter() - start)
+    return 0
+
+
+def _cmd_daemon(args) -> int:
+    """Run the ``daemon`` subcommand."""
+    from .daemon import LineProtocolDaemon, run
+    
+    if args.stdio:
+        LineProtocolDaemon().serve_stdio(sys.stdin, sys.stdout)
+    else:
+        logging.getLogger().setLevel(logging.INFO)
+        run(args.socket)
+    return 0
+
+
+def _cmd_dimension(args) -> int:
+    """Run the ``dimension`` subcommand."""
+    from .calendar_dim import generate_dimension
+    
+    if args.format == "parquet" and (args.outfile is None or args.outfile == '-'):
+        raise ValueError("Parquet output needs an --out file")
+    to_stdout = args.outfile is None or args.outfile == '-'
+    start = time.perf_counter()
+    written = generate_dimension(
+        args.outfile, date.fromisoformat(args.start), date.fromisoformat(args.end),
+        fmt=args.format, workers=args.workers, chunk_days=args.chunk_days,
+        stream=sys.stdout if to_stdout else None,
+    )
+    _report(written, 0, time.perf_counter() - start)
+    return 0
+
+
+def _cmd_serve(args) -> int:
+    """Run the ``serve`` subcommand."""
+    from .server import run
+    
+    logging.getLogger().setLevel(logging.INFO)
+    run(args.host, args.port, max_body=args.max_body, inline_limit=args.inline_limit,
+        executor=args.executor, workers=args.workers,
+        keepalive_timeout=args.keepalive_timeout)
+    return 0
+
+
+def _report(written: int, failed: int, elapsed: float):
+    """Print the completion summary to stderr."""
+    rate = written / elapsed if elapsed > 0 else 0.0
+    print(f"Converted {written} rows ({failed} failed) in {elapsed:.2f}s, "
+          f"{rate:,.0f} rows/sec", file=sys.stderr)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the argument parser for all headless subcommands."""
+    parser = argparse.ArgumentParser(
+        prog="hijri-converter",
+        description="Hijri/Gregorian date converter. Run without a command to open the GUI."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    convert = commands.add_parser("convert", help="convert a CSV date column")
+    convert.add_argument("--in", dest="infile", help="input CSV (default: stdin)")
+    convert.add_argument("--out", dest="outfile", help="output CSV (default: stdout)")
+    convert.add_argument("--col", required=True, help="name of the date column")
+    convert.add_argument("--to", required=True,
+                         choices=[c.value for c in CalendarType],
+                         help="calendar to convert the column into")
+    convert.add_argument("--out-col", help="name of the added column "
+                         "(default: <col>_<calendar>)")
+    convert.add_argument("--chunk-size", type=int, default=10000,
+                         help="rows converted per chunk (default: 10000)")
+    convert.add_argument("--on-error", default=ErrorPolicy.SENTINEL.value,
+                         choices=[ErrorPolicy.SENTINEL.value, ErrorPolicy.SKIP.value,
+                                  ErrorPolicy.RAISE.value],
+                         help="leave failed rows empty, drop them, or stop")
+    convert.add_argument("--delimiter", default=",", help="CSV delimiter")
+    convert.add_argument("--table", help="precompiled calendar table to map")
+    convert.add_argument("--algorithm", default="ummalqura", choices=["ummalqura", "kuwaiti"],
+                         help="conversion algorithm; kuwaiti converts to Hijri only")
+    convert.add_argument("--workers", type=int, nargs="?", const=0,
+                         help="convert in N worker processes (default N: CPU count); "
+                              "requires --in")
+    convert.add_argument("--chunk-mb", type=int, default=16,
+                         help="size of each worker's byte range in MiB (default: 16)")
+    convert.set_defaults(handler=_cmd_convert)
+
+    parquet = commands.add_parser("parquet", help="add Hijri columns to a Parquet file")
+    parquet.add_argument("--in", dest="infile", required=True, help="input Parquet file")
+    parquet.add_argument("--out", dest="outfile", required=True, help="output Parquet file")
+    parquet.add_argument("--col", required=True, action="append",
+                         help="date32 column to convert; may be repeated")
+    parquet.add_argument("--batch-size", type=int, default=65536,
+                         help="rows per record batch (default: 65536)")
+    parquet.add_argument("--struct", action="store_true",
+                         help="write one <col>_hijri struct column instead of three")
+    parquet.set_defaults(handler=_cmd_parquet)
+
+    dimension = commands.add_parser("dimension", help="write a calendar dimension table")
+    dimension.add_argument("--start", default="1900-01-01", help="first day (default: 1900-01-01)")
+    dimension.add_argument("--end", default="2100-12-31", help="last day (default: 2100-12-31)")
+    dimension.add_argument("--format", default="csv", choices=["csv", "jsonl", "parquet"],
+                           help="output format (default: csv)")
+    dimension.add_argument("--out", dest="outfile", help="output file (default: stdout)")
+    dimension.add_argument("--workers", type=int, nargs="?", const=0,
+                           help="render chunks in N processes (default N: CPU count)")
+    dimension.add_argument("--chunk-days", type=int, default=366,
+                           help="days rendered per chunk (default: 366)")
+    dimension.set_defaults(handler=_cmd_dimension)
+
+    serve = commands.add_parser("serve", help="run the HTTP conversion service")
+    serve.add_argument("--host", default="127.0.0.1", help="interface to bind")
+    serve.add_argument("--port", type=int, default=8080, help="TCP port (default: 8080)")
+    serve.add_argument("--max-body", type=int, default=1024 * 1024,
+                       help="largest request body in bytes (default: 1 MiB)")
+    serve.add_argument("--inline-limit", type=int, default=256,
+                       help="batches above this size run in the executor")
+    serve.add_argument("--executor", default="thread", choices=["thread", "process"],
+                       help="pool used for large batches")
+    serve.add_argument("--workers", type=int, help="executor size")
+    serve.add_argument("--keepalive-timeout", type=float, default=15.0,
+                       help="seconds an idle connection stays open")
+    serve.set_defaults(handler=_cmd_serve)
+
+    daemon = commands.add_parser("daemon", help="answer line requests on a Unix socket")
+    daemon.add_argument("--socket", default=DEFAULT_SOCKET,
+                        help=f"socket path (default: {DEFAULT_SOCKET})")
+    daemon.add_argument("--stdio", action="store_true",
+                        help="read requests from stdin and answer on stdout instead")
+    daemon.set_defaults(handler=_cmd_daemon)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run a headless subcommand and return its exit code."""
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, stream=sys.stderr,
+                        format='%(levelname)s: %(message)s')
+    try:
+        return args.handler(args)
+    except (ValueError, OSError) as e:
+        logger.error(str(e))
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""Awaitable facade over the synchronous converters for asyncio callers.
+
+Single dates and small batches are converted inline on the event loop
+through the converters' bulk row hooks, which never log. Larger batches
+are offloaded to a thread or process pool, with a semaphore bounding how
+many offloaded batches run at once.
+"""
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Iterable, List, Optional, Tuple, Union
+import asyncio
+
+from .calendar_converter import (
+    CalendarConverter, DateResult, ErrorPolicy, HijriGregorianConverter, RowError,
+)
+
+
+GREGORIAN_TARGET = "gregorian"
+HIJRI_TARGET = "hijri"
+
+_worker_converter: Optional[CalendarConverter] = None
+
+
+def _init_worker(converter: CalendarConverter):
+    """Keep the pickled converter for every batch run in this process."""
+    global _worker_converter
+    _worker_converter = converter
+
+
+def _convert_batch(converter: Optional[CalendarConverter], target: str,
+                   dates: List[Tuple[int, int, int]], on_error: ErrorPolicy,
+                   sentinel: Any) -> Tuple[List[Any], List[RowError]]:
+    """Convert a materialized batch; returns (results, errors)."""
+    converter = converter if converter is not None else _worker_converter
+    convert_many = (converter.to_hijri_many if target == HIJRI_TARGET
+                    else converter.to_gregorian_many)
+    errors: List[RowError] = []
+    results = list(convert_many(dates, on_error=on_error, sentinel=sentinel, errors=errors))
+    return results, errors
+
+
+class AsyncCalendarConverter:
+    """Async wrapper around a ``CalendarConverter``.
+
+    Args:
+        converter: Converter to wrap (default: index-backed
+            ``HijriGregorianConverter``). Process pools receive a pickled
+            copy, so converters mapping a table file need threads.
+        inline_limit: Batches up to this size run on the event loop.
+        executor: ``"thread"``, ``"process"`` or an existing ``Executor``,
+            which is then not shut down by ``close``.
+        max_workers: Pool size when the pool is created here.
+        max_concurrency: Offloaded batches allowed in flight at once
+            (default: unlimited); further batches wait their turn.
+    """
+
+    def __init__(self, converter: Optional[CalendarConverter] = None,
+                 inline_limit: int = 256,
+                 executor: Union[str, Executor] = "thread",
+                 max_workers: Optional[int] = None,
+                 max_concurrency: Optional[int] = None):
+        if isinstance(executor, str) and executor not in ("thread", "process"):
+            raise ValueError(f"Unknown executor {executor!r}; expected 'thread' or 'process'")
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.converter = converter if converter is not None else HijriGregorianConverter(use_index=True)
+        self.inline_limit = inline_limit
+        self._executor_kind = executor
+        self._max_workers = max_workers
+        self._executor: Optional[Executor] = executor if isinstance(executor, Executor) else None
+        self._owns_executor = self._executor is None
+        self._semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    async def to_gregorian(self, day: int, month: int, year: int) -> DateResult:
+        """Convert a Hijri date to Gregorian inline."""
+        return self._single(self.converter._to_gregorian_row(day, month, year))
+
+    async def to_hijri(self, day: int, month: int, year: int) -> DateResult:
+        """Convert a Gregorian date to Hijri inline."""
+        return self._single(self.converter._to_hijri_row(day, month, year))
+
+    async def to_gregorian_many(self, dates: Iterable[Tuple[int, int, int]],
+                                on_error: ErrorPolicy = ErrorPolicy.SENTINEL,
+                                sentinel: Any = None,
+                                errors: Optional[List[RowError]] = None) -> List[Any]:
+        """Convert (day, month, year) Hijri tuples to Gregorian.
+
+        Same arguments as ``CalendarConverter.to_gregorian_many``, but the
+        results come back as a list.
+        """
+        return await self._many(GREGORIAN_TARGET, dates, on_error, sentinel, errors)
+
+    async def to_hijri_many(self, dates: Iterable[Tuple[int, int, int]],
+                            on_error: ErrorPolicy = ErrorPolicy.SENTINEL,
+                            sentinel: Any = None,
+                            errors: Optional[List[RowError]] = None) -> List[Any]:
+        """Convert (day, month, year) Gregorian tuples to Hijri."""
+        return await self._many(HIJRI_TARGET, dates, on_error, sentinel, errors)
+
+    async def close(self):
+        """Shut down a pool created by this converter."""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def __aenter__(self) -> "AsyncCalendarConverter":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    @staticmethod
+    def _single(result) -> DateResult:
+        """Return the full ``DateResult`` for a row-hook result."""
+        to_date_result = getattr(result, "to_date_result", None)
+        return to_date_result() if to_date_result is not None else result
+
+    async def _many(self, target: str, dates: Iterable[Tuple[int, int, int]],
+                    on_error: ErrorPolicy, sentinel: Any,
+                    errors: Optional[List[RowError]]) -> List[Any]:
+        """Convert inline or in the pool depending on the batch size."""
+        on_error = ErrorPolicy(on_error)
+        if on_error is ErrorPolicy.COLLECT and errors is None:
+            raise ValueError("ErrorPolicy.COLLECT requires an errors list")
+        dates = dates if isinstance(dates, list) else list(dates)
+
+        if len(dates) <= self.inline_limit:
+            results, failed = _convert_batch(self.converter, target, dates, on_error, sentinel)
+        elif self._semaphore is not None:
+            async with self._semaphore:
+                results, failed = await self._offload(target, dates, on_error, sentinel)
+        else:
+            results, failed = await self._offload(target, dates, on_error, sentinel)
+
+        if errors is not None:
+            errors.extend(failed)
+        return results
+
+    async def _offload(self, target: str, dates: List[Tuple[int, int, int]],
+                       on_error: ErrorPolicy, sentinel: Any):
+        """Run one batch in the pool, creating the pool on first use."""
+        executor = self._get_executor()
+        # Workers of a pool created here already hold the converter.
+        converter = (None if self._owns_executor and self._executor_kind == "process"
+                     else self.converter)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, _convert_batch, converter,
+                                          target, dates, on_error, sentinel)
+
+    def _get_executor(self) -> Executor:
+        """Return the pool, creating it on first use."""
+        if self._executor is None:
+            if self._executor_kind == "process":
+                self._executor = ProcessPoolExecutor(self._max_workers, initializer=_init_worker,
+                                                     initargs=(self.converter,))
+            else:
+                self._executor = ThreadPoolExecutor(self._max_workers)
+        return self._executor
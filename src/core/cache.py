@@ -0,0 +1,138 @@
+"""Bounded, thread-safe result cache for calendar conversions."""
+
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Callable, Hashable, NamedTuple, Optional
+import threading
+import time
+
+
+class EvictionPolicy(Enum):
+    """Which entry to drop when the cache is full."""
+    LRU = "lru"    # Least recently used
+    FIFO = "fifo"  # Oldest inserted
+
+
+class CacheInfo(NamedTuple):
+    """Cache statistics, in the spirit of ``functools.lru_cache``."""
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+_MISSING = object()
+
+
+class ConversionCache:
+    """Bounded mapping of conversion keys to results.
+
+    Args:
+        maxsize: Maximum number of entries kept.
+        policy: Eviction policy applied when ``maxsize`` is reached.
+        ttl: Optional lifetime of an entry in seconds.
+    """
+
+    def __init__(self, maxsize: int = 4096,
+                 policy: EvictionPolicy = EvictionPolicy.LRU,
+                 ttl: Optional[float] = None):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.maxsize = maxsize
+        self.policy = EvictionPolicy(policy)
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for ``key``, computing it on a miss.
+
+        ``compute`` runs outside the lock; exceptions propagate and nothing
+        is cached for the key.
+        """
+        value = self._lookup(key)
+        if value is not _MISSING:
+            return value
+        value = compute()
+        self._store(key, value)
+        return value
+
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None):
+        """Drop every entry, or only those whose key matches ``predicate``."""
+        with self._lock:
+            if predicate is None:
+                self._data.clear()
+            else:
+                for key in [k for k in self._data if predicate(k)]:
+                    del self._data[key]
+
+    def cache_info(self) -> CacheInfo:
+        """Return current statistics."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions,
+                             self._expirations, self.maxsize, len(self._data))
+
+    def reset_stats(self):
+        """Zero the hit/miss/eviction counters."""
+        with self._lock:
+            self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def _lookup(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._misses += 1
+                return _MISSING
+            value, expires = entry
+            if expires is not None and expires <= time.monotonic():
+                del self._data[key]
+                self._expirations += 1
+                self._misses += 1
+                return _MISSING
+            if self.policy is EvictionPolicy.LRU:
+                self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def _store(self, key: Hashable, value: Any):
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            if key in self._data:
+                self._data[key] = (value, expires)
+                return
+            while len(self._data) >= self.maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+            self._data[key] = (value, expires)
+
+
+_shared_cache: Optional[ConversionCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_cache() -> ConversionCache:
+    """Return the process-wide conversion cache, creating it on first use."""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = ConversionCache()
+        return _shared_cache
+
+
+def configure_shared_cache(maxsize: int = 4096,
+                           policy: EvictionPolicy = EvictionPolicy.LRU,
+                           ttl: Optional[float] = None) -> ConversionCache:
+    """Replace the process-wide cache with a newly configured one."""
+    global _shared_cache
+    with _shared_lock:
+        _shared_cache = ConversionCache(maxsize, policy, ttl)
+        return _shared_cache
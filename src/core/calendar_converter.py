@@ -2,11 +2,20 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from datetime import date, datetime
-from typing import Optional
+from datetime import date
+from enum import Enum
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 import logging
 
-from hijridate import Gregorian, Hijri
+from ..config.settings import CalendarType
+from .cache import ConversionCache, get_shared_cache
+from .calendars import (
+    GREGORIAN, KUWAITI, ORDINAL_TO_JDN, UmmAlQuraCalendar, kuwaiti_julian_day,
+)
+from .month_index import MonthStartIndex, get_month_index
+from .validation import GregorianValidator, HijriValidator
+from .vectorized import HijriArrays, kuwaiti_to_hijri
 
 
 logger = logging.getLogger(__name__)
@@ -23,6 +32,86 @@ class DateResult:
     formatted_date: str
 
 
+WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday",
+                 "Friday", "Saturday", "Sunday")
+"""English weekday names indexed by ``date.weekday()``; locale independent."""
+
+
+class CompactDateResult:
+    """Memory-compact conversion result for bulk jobs.
+    
+    Stores only integers; ``weekday`` and ``formatted_date`` are rendered
+    on access. Exposes the same attributes as ``DateResult``.
+    
+    Args:
+        day: Day of month.
+        month: Month number.
+        year: Year.
+        weekday_index: ``date.weekday()`` value (0 is Monday), or -1 when
+            the weekday is not reported.
+    """
+    
+    __slots__ = ('day', 'month', 'year', 'weekday_index')
+    
+    def __init__(self, day: int, month: int, year: int, weekday_index: int = -1):
+        self.day = day
+        self.month = month
+        self.year = year
+        self.weekday_index = weekday_index
+    
+    @property
+    def month_name(self) -> str:
+        """Always empty; filled by localization like ``DateResult``."""
+        return ""
+    
+    @property
+    def weekday(self) -> str:
+        """English weekday name, or an empty string."""
+        index = self.weekday_index
+        return WEEKDAY_NAMES[index] if index >= 0 else ""
+    
+    @property
+    def formatted_date(self) -> str:
+        """Date as day/month/year."""
+        return f"{self.day}/{self.month}/{self.year}"
+    
+    def to_date_result(self) -> DateResult:
+        """Return an equivalent eager ``DateResult``."""
+        return DateResult(self.day, self.month, self.year, self.month_name,
+                          self.weekday, self.formatted_date)
+    
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CompactDateResult):
+            return (self.day, self.month, self.year, self.weekday_index) == (
+                other.day, other.month, other.year, other.weekday_index)
+        if isinstance(other, DateResult):
+            return self.to_date_result() == other
+        return NotImplemented
+    
+    def __hash__(self) -> int:
+        return hash((self.day, self.month, self.year, self.weekday_index))
+    
+    def __repr__(self) -> str:
+        return (f"CompactDateResult(day={self.day}, month={self.month}, "
+                f"year={self.year}, weekday={self.weekday!r})")
+
+
+class ErrorPolicy(Enum):
+    """How bulk conversions handle rows that fail to convert."""
+    RAISE = "raise"        # Stop and re-raise the first error
+    SKIP = "skip"          # Drop the row silently
+    SENTINEL = "sentinel"  # Yield the sentinel value in the row's place
+    COLLECT = "collect"    # Drop the row and append a RowError to a list
+
+
+@dataclass
+class RowError:
+    """A row that failed during bulk conversion."""
+    index: int
+    row: Any
+    error: Exception
+
+
 class CalendarConverter(ABC):
     """Abstract base class for calendar converters."""
     
@@ -35,70 +124,415 @@ class CalendarConverter(ABC):
     def to_hijri(self, day: int, month: int, year: int) -> DateResult:
         """Convert to Hijri calendar."""
         pass
+    
+    def to_gregorian_many(self, dates: Iterable[Tuple[int, int, int]],
+                          on_error: ErrorPolicy = ErrorPolicy.SENTINEL,
+                          sentinel: Any = None,
+                          errors: Optional[List[RowError]] = None) -> Iterator[Any]:
+        """Lazily convert (day, month, year) Hijri tuples to Gregorian.
+        
+        Args:
+            dates: Any iterable of (day, month, year) tuples; consumed lazily.
+            on_error: What to do with rows that fail to convert.
+            sentinel: Value yielded for failed rows under ``SENTINEL``.
+            errors: List that receives a ``RowError`` per failed row;
+                required for ``COLLECT``.
+        
+        Converters may yield ``CompactDateResult`` objects here; they expose
+        the same attributes as ``DateResult``.
+        """
+        return self._convert_many(self._to_gregorian_row, dates,
+                                  on_error, sentinel, errors)
+    
+    def to_hijri_many(self, dates: Iterable[Tuple[int, int, int]],
+                      on_error: ErrorPolicy = ErrorPolicy.SENTINEL,
+                      sentinel: Any = None,
+                      errors: Optional[List[RowError]] = None) -> Iterator[Any]:
+        """Lazily convert (day, month, year) Gregorian tuples to Hijri.
+        
+        See ``to_gregorian_many`` for the arguments.
+        """
+        return self._convert_many(self._to_hijri_row, dates,
+                                  on_error, sentinel, errors)
+    
+    def _to_gregorian_row(self, day: int, month: int, year: int) -> DateResult:
+        """Convert one bulk row; subclasses may skip per-call logging here."""
+        return self.to_gregorian(day, month, year)
+    
+    def _to_hijri_row(self, day: int, month: int, year: int) -> DateResult:
+        """Convert one bulk row; subclasses may skip per-call logging here."""
+        return self.to_hijri(day, month, year)
+    
+    @staticmethod
+    def _convert_many(convert: Callable[..., Any],
+                      dates: Iterable[Tuple[int, int, int]],
+                      on_error: ErrorPolicy, sentinel: Any,
+                      errors: Optional[List[RowError]],
+                      chunk_size: int = 0) -> Iterator[Any]:
+        """Validate bulk arguments, then return the row generator.
+        
+        With ``chunk_size``, ``convert`` takes a list of up to that many
+        rows and returns a result or an exception for each of them; input
+        is then read ahead one chunk at a time.
+        """
+        on_error = ErrorPolicy(on_error)
+        if on_error is ErrorPolicy.COLLECT and errors is None:
+            raise ValueError("ErrorPolicy.COLLECT requires an errors list")
+        
+        def generate():
+            for index, row in enumerate(dates):
+                try:
+                    day, month, year = row
+                    result = convert(day, month, year)
+                except (ValueError, TypeError, OverflowError) as e:
+                    if errors is not None:
+                        errors.append(RowError(index, row, e))
+                    if on_error is ErrorPolicy.RAISE:
+                        raise
+                    if on_error is ErrorPolicy.SENTINEL:
+                        yield sentinel
+                    continue
+                yield result
+        
+        def generate_chunks():
+            index = 0
+            rows = iter(dates)
+            while True:
+                chunk = list(islice(rows, chunk_size))
+                if not chunk:
+                    return
+                for row, result in zip(chunk, convert(chunk)):
+                    if isinstance(result, Exception):
+                        if errors is not None:
+                            errors.append(RowError(index, row, result))
+                        if on_error is ErrorPolicy.RAISE:
+                            raise result
+                        if on_error is ErrorPolicy.SENTINEL:
+                            yield sentinel
+                    else:
+                        yield result
+                    index += 1
+        
+        return generate_chunks() if chunk_size else generate()
 
 
 class HijriGregorianConverter(CalendarConverter):
-    """Concrete implementation of Hijri-Gregorian converter."""
+    """Concrete implementation of Hijri-Gregorian converter.
     
-    def __init__(self):
-        self._validate_date = self._create_validator()
+    Args:
+        use_index: Convert through the precomputed month-start index
+            instead of building hijridate objects for every call.
+        index: Explicit month-start index to use; implies ``use_index``.
+        table_path: Precompiled table file (see ``table_file``) to map
+            read-only as the index; implies ``use_index``.
+    """
     
-    def _create_validator(self):
-        """Create date validation function."""
-        def validate_date(year: int, month: int, day: int) -> bool:
-            try:
-                datetime(year, month, day)
-                return True
-            except ValueError as e:
-                logger.warning(f"Invalid date: {year}-{month}-{day}, Error: {e}")
-                return False
-        return validate_date
+    BULK_CHUNK_SIZE = 1024
+    
+    def __init__(self, use_index: bool = False,
+                 index: Optional[MonthStartIndex] = None,
+                 table_path: Optional[str] = None):
+        if index is None and table_path is not None:
+            from .table_file import load_table
+            index = load_table(table_path)
+        if index is None and use_index:
+            index = get_month_index()
+        self._index = index
+        self._hijri_calendar = UmmAlQuraCalendar(index) if index is not None else None
+        self._validate_hijri = HijriValidator(index)
+        self._validate_gregorian = GregorianValidator(index)
+    
+    @property
+    def backend(self) -> str:
+        """Name of the conversion backend in use."""
+        return "index" if self._index is not None else "hijridate"
     
     def to_gregorian(self, day: int, month: int, year: int) -> DateResult:
         """Convert Hijri date to Gregorian."""
-        if not self._validate_date(year, month, day):
-            raise ValueError(f"Invalid Hijri date: {year}-{month}-{day}")
+        if self._index is None and not self._validate_hijri(year, month, day):
+            raise self._hijri_error(year, month, day)
         
         try:
-            hijri_date = Hijri(year, month, day)
-            gregorian = hijri_date.to_gregorian()
-            
-            return DateResult(
-                day=gregorian.day,
-                month=gregorian.month,
-                year=gregorian.year,
-                month_name="",  # Will be filled by localization
-                weekday=gregorian.strftime("%A"),
-                formatted_date=f"{gregorian.day}/{gregorian.month}/{gregorian.year}"
-            )
+            return self._hijri_to_gregorian(day, month, year)
+        except ValueError:
+            raise  # invalid input, already described
         except Exception as e:
             logger.error(f"Error converting Hijri to Gregorian: {e}")
             raise
     
     def to_hijri(self, day: int, month: int, year: int) -> DateResult:
         """Convert Gregorian date to Hijri."""
-        if not self._validate_date(year, month, day):
-            raise ValueError(f"Invalid Gregorian date: {year}-{month}-{day}")
+        if self._index is None and not self._validate_gregorian(year, month, day):
+            raise self._gregorian_error(year, month, day)
         
         try:
-            gregorian_date = Gregorian(year, month, day)
-            hijri = gregorian_date.to_hijri()
-            
-            return DateResult(
-                day=hijri.day,
-                month=hijri.month,
-                year=hijri.year,
-                month_name="",  # Will be filled by localization
-                weekday="",  # Hijri weekdays not commonly used in same way
-                formatted_date=f"{hijri.day}/{hijri.month}/{hijri.year}"
-            )
+            return self._gregorian_to_hijri(day, month, year)
+        except ValueError:
+            raise  # invalid input, already described
         except Exception as e:
             logger.error(f"Error converting Gregorian to Hijri: {e}")
             raise
+    
+    def to_gregorian_many(self, dates: Iterable[Tuple[int, int, int]],
+                          on_error: ErrorPolicy = ErrorPolicy.SENTINEL,
+                          sentinel: Any = None,
+                          errors: Optional[List[RowError]] = None) -> Iterator[Any]:
+        """Lazily convert (day, month, year) Hijri tuples to Gregorian.
+        
+        See ``CalendarConverter.to_gregorian_many``. The index backend reads
+        ``BULK_CHUNK_SIZE`` rows ahead and converts them in one pass.
+        """
+        if self._index is None:
+            return super().to_gregorian_many(dates, on_error, sentinel, errors)
+        return self._convert_many(self._to_gregorian_chunk, dates, on_error, sentinel,
+                                  errors, self.BULK_CHUNK_SIZE)
+    
+    def to_hijri_many(self, dates: Iterable[Tuple[int, int, int]],
+                      on_error: ErrorPolicy = ErrorPolicy.SENTINEL,
+                      sentinel: Any = None,
+                      errors: Optional[List[RowError]] = None) -> Iterator[Any]:
+        """Lazily convert (day, month, year) Gregorian tuples to Hijri.
+        
+        See ``to_gregorian_many`` for the arguments. The index backend
+        reads ``BULK_CHUNK_SIZE`` rows ahead and converts each chunk with
+        one ``MonthStartIndex.hijri_from_ordinals`` call.
+        """
+        if self._index is None:
+            return super().to_hijri_many(dates, on_error, sentinel, errors)
+        return self._convert_many(self._to_hijri_chunk, dates, on_error, sentinel,
+                                  errors, self.BULK_CHUNK_SIZE)
+    
+    def _to_gregorian_row(self, day: int, month: int, year: int) -> CompactDateResult:
+        """Convert without logging; raises ValueError for invalid input."""
+        if self._index is None and not self._validate_hijri(year, month, day):
+            raise self._hijri_error(year, month, day)
+        gregorian = self._gregorian_date(day, month, year)
+        return CompactDateResult(gregorian.day, gregorian.month, gregorian.year,
+                                 gregorian.weekday())
+    
+    def _to_hijri_row(self, day: int, month: int, year: int) -> CompactDateResult:
+        """Convert without logging; raises ValueError for invalid input."""
+        if self._index is None and not self._validate_gregorian(year, month, day):
+            raise self._gregorian_error(year, month, day)
+        h_year, h_month, h_day = self._hijri_tuple(day, month, year)
+        return CompactDateResult(h_day, h_month, h_year)
+    
+    def _to_gregorian_chunk(self, rows: List[Any]) -> List[Any]:
+        """Convert bulk rows on the index backend; one result or exception per row."""
+        ordinal_from_hijri = self._index.ordinal_from_hijri
+        fromordinal = date.fromordinal
+        results: List[Any] = []
+        for row in rows:
+            try:
+                day, month, year = row
+            except (ValueError, TypeError) as e:
+                results.append(e)
+                continue
+            try:
+                gregorian = fromordinal(ordinal_from_hijri(year, month, day))
+            except (ValueError, TypeError, OverflowError):
+                results.append(self._hijri_error(year, month, day))
+                continue
+            results.append(CompactDateResult(gregorian.day, gregorian.month, gregorian.year,
+                                             gregorian.weekday()))
+        return results
+    
+    def _to_hijri_chunk(self, rows: List[Any]) -> List[Any]:
+        """Convert bulk rows on the index backend; one result or exception per row."""
+        index = self._index
+        lo, hi = index.min_ordinal, index.max_ordinal
+        results: List[Any] = []
+        ordinals: List[int] = []
+        for row in rows:
+            try:
+                day, month, year = row
+            except (ValueError, TypeError) as e:
+                results.append(e)
+                continue
+            try:
+                ordinal = date(year, month, day).toordinal()
+            except (ValueError, TypeError, OverflowError):
+                ordinal = 0
+            if lo <= ordinal <= hi:
+                results.append(None)
+                ordinals.append(ordinal)
+            else:
+                results.append(self._gregorian_error(year, month, day))
+        
+        converted = iter(index.hijri_from_ordinals(ordinals))
+        for i, result in enumerate(results):
+            if result is None:
+                h_year, h_month, h_day = next(converted)
+                results[i] = CompactDateResult(h_day, h_month, h_year)
+        return results
+    
+    def _gregorian_error(self, year: int, month: int, day: int) -> ValueError:
+        """Return the error for a Gregorian date that cannot be converted.
+        
+        Real dates outside the supported range get an ``OutOfRangeError``.
+        """
+        return self._validate_gregorian.error(year, month, day)
+    
+    def _hijri_error(self, year: int, month: int, day: int) -> ValueError:
+        """Return the error for a Hijri date that cannot be converted.
+        
+        Real dates outside the supported range get an ``OutOfRangeError``.
+        """
+        return self._validate_hijri.error(year, month, day)
+    
+    def _hijri_to_gregorian(self, day: int, month: int, year: int) -> DateResult:
+        """Convert a Hijri date validated by the caller or the index."""
+        gregorian = self._gregorian_date(day, month, year)
+        
+        return DateResult(
+            day=gregorian.day,
+            month=gregorian.month,
+            year=gregorian.year,
+            month_name="",  # Will be filled by localization
+            weekday=WEEKDAY_NAMES[gregorian.weekday()],
+            formatted_date=f"{gregorian.day}/{gregorian.month}/{gregorian.year}"
+        )
+    
+    def _gregorian_to_hijri(self, day: int, month: int, year: int) -> DateResult:
+        """Convert a Gregorian date validated by the caller or the index."""
+        h_year, h_month, h_day = self._hijri_tuple(day, month, year)
+        
+        return DateResult(
+            day=h_day,
+            month=h_month,
+            year=h_year,
+            month_name="",  # Will be filled by localization
+            weekday="",  # Hijri weekdays not commonly used in same way
+            formatted_date=f"{h_day}/{h_month}/{h_year}"
+        )
+    
+    def _gregorian_date(self, day: int, month: int, year: int) -> date:
+        """Return the Gregorian date for a Hijri date using the active backend.
+        
+        The index backend validates as it converts and raises ValueError.
+        """
+        if self._hijri_calendar is not None:
+            try:
+                jdn = self._hijri_calendar.to_jdn(year, month, day)
+            except (ValueError, TypeError, OverflowError):
+                raise self._hijri_error(year, month, day) from None
+            return date.fromordinal(jdn - ORDINAL_TO_JDN)
+        from hijridate import Hijri
+        return Hijri(year, month, day).to_gregorian()
+    
+    def _hijri_tuple(self, day: int, month: int, year: int) -> Tuple[int, int, int]:
+        """Return Hijri (year, month, day) for a Gregorian date using the active backend.
+        
+        The index backend validates as it converts and raises ValueError.
+        """
+        if self._hijri_calendar is not None:
+            try:
+                return self._hijri_calendar.from_jdn(GREGORIAN.to_jdn(year, month, day))
+            except (ValueError, TypeError, OverflowError):
+                raise self._gregorian_error(year, month, day) from None
+        from hijridate import Gregorian
+        return Gregorian(year, month, day).to_hijri().datetuple()
+
+
+class CachedConverter(CalendarConverter):
+    """Caching layer around another converter.
+    
+    Results are keyed by the wrapped converter's backend, so switching
+    backends never serves stale results; call ``invalidate`` to also free
+    the old entries. Single calls and bulk rows are cached under separate
+    keys, since they return ``DateResult`` and ``CompactDateResult``
+    respectively. Cached results are shared between callers and must not
+    be mutated.
+    
+    Args:
+        converter: Converter whose results are cached.
+        cache: Cache to use; defaults to the process-wide shared cache.
+    """
+    
+    def __init__(self, converter: Optional[CalendarConverter] = None,
+                 cache: Optional[ConversionCache] = None):
+        self.converter = converter if converter is not None else HijriGregorianConverter()
+        self.cache = cache if cache is not None else get_shared_cache()
+    
+    @property
+    def backend(self) -> str:
+        """Backend of the wrapped converter, used in cache keys."""
+        return getattr(self.converter, "backend", type(self.converter).__name__)
+    
+    def to_gregorian(self, day: int, month: int, year: int) -> DateResult:
+        """Convert Hijri date to Gregorian, using the cache."""
+        return self.cache.get_or_compute(
+            (self.backend, "to_gregorian", day, month, year),
+            lambda: self.converter.to_gregorian(day, month, year)
+        )
+    
+    def to_hijri(self, day: int, month: int, year: int) -> DateResult:
+        """Convert Gregorian date to Hijri, using the cache."""
+        return self.cache.get_or_compute(
+            (self.backend, "to_hijri", day, month, year),
+            lambda: self.converter.to_hijri(day, month, year)
+        )
+    
+    def _to_gregorian_row(self, day: int, month: int, year: int) -> DateResult:
+        """Bulk row conversion through the cache."""
+        return self.cache.get_or_compute(
+            (self.backend, "to_gregorian_row", day, month, year),
+            lambda: self.converter._to_gregorian_row(day, month, year)
+        )
+    
+    def _to_hijri_row(self, day: int, month: int, year: int) -> DateResult:
+        """Bulk row conversion through the cache."""
+        return self.cache.get_or_compute(
+            (self.backend, "to_hijri_row", day, month, year),
+            lambda: self.converter._to_hijri_row(day, month, year)
+        )
+    
+    def invalidate(self, backend: Optional[str] = None):
+        """Drop cached results, optionally only those of one backend."""
+        if backend is None:
+            self.cache.invalidate()
+        else:
+            self.cache.invalidate(lambda key: key[0] == backend)
+    
+    def cache_info(self):
+        """Return hit/miss/eviction statistics of the underlying cache."""
+        return self.cache.cache_info()
 
 
-class KuwaitiCalendarConverter:
-    """Alternative converter using Kuwaiti calendar algorithm."""
+class KuwaitiCalendarConverter(CalendarConverter):
+    """Alternative converter using Kuwaiti calendar algorithm.
+    
+    Converts Gregorian to Hijri only; ``to_gregorian`` raises ValueError.
+    
+    Args:
+        integer_math: Use the exact fixed-point version of the algorithm
+            instead of the original floating-point constants.
+        true_jdn: Pivot through the true Julian Day Number instead of the
+            original port's month-shifted one, writing the algorithm's day 0
+            and month 0 labels as the day after the previous day's label.
+            Dates then differ from the default mode (2024-03-11 is
+            1445-09-01 rather than 1445-10-02); ``--algorithm kuwaiti``
+            uses this mode.
+    """
+    
+    WEEKDAY_NAMES = ["Ahad", "Ithnin", "Thulatha", "Arbaa", "Khams", "Jumuah", "Sabt"]
+    
+    def __init__(self, integer_math: bool = False, true_jdn: bool = False):
+        self.integer_math = integer_math
+        self.true_jdn = true_jdn
+    
+    @property
+    def backend(self) -> str:
+        """Name of the conversion mode in use, used in cache keys."""
+        return "kuwaiti-jdn" if self.true_jdn else "kuwaiti"
+    
+    def to_gregorian(self, day: int, month: int, year: int) -> DateResult:
+        """Not supported; the Kuwaiti algorithm only converts to Hijri."""
+        raise ValueError("The Kuwaiti algorithm only converts Gregorian to Hijri")
+    
+    def to_hijri(self, day: int, month: int, year: int) -> DateResult:
+        """Convert Gregorian date to Hijri; raises ValueError for invalid dates."""
+        return self.convert_to_hijri(date(year, month, day))
     
     @staticmethod
     def gmod(n: int, m: int) -> int:
@@ -107,6 +541,11 @@ class KuwaitiCalendarConverter:
     
     def convert_to_hijri(self, gregorian_date: date) -> DateResult:
         """Convert Gregorian date to Hijri using Kuwaiti algorithm."""
+        if self.true_jdn:
+            return self._convert_to_hijri_true_jdn(gregorian_date)
+        if self.integer_math:
+            return self._convert_to_hijri_integer(gregorian_date)
+        
         day = gregorian_date.day
         month = gregorian_date.month
         year = gregorian_date.year
@@ -168,6 +607,151 @@ class KuwaitiCalendarConverter:
             month=int(im),
             year=int(iy),
             month_name="",
-            weekday=["Ahad", "Ithnin", "Thulatha", "Arbaa", "Khams", "Jumuah", "Sabt"][wd - 1],
+            weekday=self.WEEKDAY_NAMES[wd - 1],
             formatted_date=f"{int(id)}/{int(im)}/{int(iy)}"
         )
+    
+    def _convert_to_hijri_integer(self, gregorian_date: date) -> DateResult:
+        """Kuwaiti algorithm with every fractional constant scaled to an integer.
+        
+        Same steps as the float path, pivoting through the Julian day.
+        """
+        jd = kuwaiti_julian_day(gregorian_date.year, gregorian_date.month,
+                                gregorian_date.day)
+        wd = (jd + 1) % 7
+        iy, im, id = KUWAITI.from_jdn(jd)
+        
+        return DateResult(
+            day=id,
+            month=im,
+            year=iy,
+            month_name="",
+            weekday=self.WEEKDAY_NAMES[wd],
+            formatted_date=f"{id}/{im}/{iy}"
+        )
+    
+    def _convert_to_hijri_true_jdn(self, gregorian_date: date) -> DateResult:
+        """Kuwaiti calendar on the true Julian day, without day 0 or month 0."""
+        jd = gregorian_date.toordinal() + ORDINAL_TO_JDN
+        iy, im, id = KUWAITI.from_jdn(jd)
+        if id == 0 or im == 0:
+            iy, im, id = KUWAITI.from_jdn(jd - 1)
+            id += 1
+        
+        return DateResult(
+            day=id,
+            month=im,
+            year=iy,
+            month_name="",
+            weekday=self.WEEKDAY_NAMES[(jd + 1) % 7],
+            formatted_date=f"{id}/{im}/{iy}"
+        )
+    
+    def convert_to_hijri_batch(self, values) -> HijriArrays:
+        """Convert an array of Gregorian dates to Hijri using NumPy.
+        
+        Args:
+            values: Array-like of proleptic Gregorian ordinals
+                (``date.toordinal()``) or ``datetime64`` values.
+        
+        Returns:
+            Parallel year/month/day/weekday arrays; weekday is 1 (Ahad)
+            through 7 (Sabt), matching the names used by ``convert_to_hijri``.
+        """
+        return kuwaiti_to_hijri(values)
+
+
+class RangeStep(Enum):
+    """Step size for ``iter_date_range``."""
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
+class DualDate(NamedTuple):
+    """One day of a dual calendar."""
+    gregorian: date
+    hijri: Tuple[int, int, int]  # (year, month, day)
+    weekday: int  # date.weekday(): 0 is Monday
+
+
+_GREGORIAN_MONTH_DAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _gregorian_month_length(year: int, month: int) -> int:
+    """Return the number of days in a Gregorian month."""
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _GREGORIAN_MONTH_DAYS[month - 1]
+
+
+def iter_date_range(start, end=None, step: RangeStep = RangeStep.DAY,
+                    calendar: CalendarType = CalendarType.GREGORIAN,
+                    index: Optional[MonthStartIndex] = None) -> Iterator[DualDate]:
+    """Lazily yield dual-calendar dates from ``start`` to ``end`` inclusive.
+    
+    Only ``start`` is converted; every later date is reached by adding days
+    and rolling the Hijri month over using the Umm al-Qura month lengths,
+    so each step is O(1).
+    
+    Args:
+        start: First date; a ``datetime.date`` for Gregorian, or a
+            (year, month, day) tuple when ``calendar`` is Hijri.
+        end: Last date in the same form, or None to run to the end of the
+            supported range.
+        step: Distance between yielded dates. ``MONTH`` steps keep the
+            start's day of month, clamped to shorter months.
+        calendar: Calendar of ``start``/``end`` and of ``MONTH`` steps.
+        index: Month-start index to use; defaults to the shared one.
+    """
+    index = index if index is not None else get_month_index()
+    step = RangeStep(step)
+    calendar = CalendarType(calendar)
+    
+    if calendar is CalendarType.HIJRI:
+        ordinal = index.ordinal_from_hijri(*start)
+        last = index.ordinal_from_hijri(*end) if end is not None else index.max_ordinal
+    else:
+        ordinal = start.toordinal()
+        last = end.toordinal() if end is not None else index.max_ordinal
+    last = min(last, index.max_ordinal)
+    
+    h_year, h_month, h_day = index.hijri_from_ordinal(ordinal)
+    month_length = index.month_length(h_year, h_month)
+    gregorian = date.fromordinal(ordinal)
+    anchor = h_day if calendar is CalendarType.HIJRI else gregorian.day
+    max_year = index.hijri_range[1][0]
+    
+    while ordinal <= last:
+        yield DualDate(gregorian, (h_year, h_month, h_day), gregorian.weekday())
+        
+        if step is RangeStep.DAY:
+            days = 1
+        elif step is RangeStep.WEEK:
+            days = 7
+        elif calendar is CalendarType.HIJRI:
+            if h_year == max_year and h_month == 12:
+                return
+            n_year, n_month = (h_year + 1, 1) if h_month == 12 else (h_year, h_month + 1)
+            n_day = min(anchor, index.month_length(n_year, n_month))
+            days = month_length - h_day + n_day
+        else:
+            n_year, n_month = ((gregorian.year + 1, 1) if gregorian.month == 12
+                               else (gregorian.year, gregorian.month + 1))
+            n_day = min(anchor, _gregorian_month_length(n_year, n_month))
+            days = (_gregorian_month_length(gregorian.year, gregorian.month)
+                    - gregorian.day + n_day)
+        
+        ordinal += days
+        if ordinal > last:
+            return
+        gregorian = date.fromordinal(ordinal)
+        h_day += days
+        while h_day > month_length:
+            h_day -= month_length
+            if h_month == 12:
+                h_year += 1
+                h_month = 1
+            else:
+                h_month += 1
+            month_length = index.month_length(h_year, h_month)
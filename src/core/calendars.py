@@ -0,0 +1,164 @@
+"""Calendars built around a shared Julian Day Number (JDN) pivot.
+
+Each calendar only maps its own (year, month, day) to and from an integer
+JDN. Conversions, day differences and weekdays are then plain integer
+operations on that one representation.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Optional, Tuple
+
+from .month_index import MonthStartIndex, get_month_index
+from .vectorized import (
+    KUWAITI_EPOCH, KUWAITI_IYEAR, KUWAITI_MONTH, KUWAITI_MONTH_BIAS,
+    KUWAITI_SCALE, KUWAITI_SHIFT,
+)
+
+
+DateTuple = Tuple[int, int, int]
+
+# JDN of the day before 0001-01-01, so JDN = ordinal + ORDINAL_TO_JDN.
+ORDINAL_TO_JDN = 1721425
+
+
+class Calendar(ABC):
+    """A calendar defined by its mapping to Julian Day Numbers."""
+
+    name = ""
+
+    @abstractmethod
+    def to_jdn(self, year: int, month: int, day: int) -> int:
+        """Return the JDN of a date; raises ValueError if it is invalid."""
+
+    @abstractmethod
+    def from_jdn(self, jdn: int) -> DateTuple:
+        """Return the (year, month, day) of a JDN."""
+
+    def convert(self, year: int, month: int, day: int, target: "Calendar") -> DateTuple:
+        """Convert a date of this calendar into ``target``."""
+        return target.from_jdn(self.to_jdn(year, month, day))
+
+    def add_days(self, year: int, month: int, day: int, days: int) -> DateTuple:
+        """Return the date ``days`` after (or before, if negative) a date."""
+        return self.from_jdn(self.to_jdn(year, month, day) + days)
+
+    def days_between(self, start: DateTuple, end: DateTuple) -> int:
+        """Return the number of days from ``start`` to ``end``."""
+        return self.to_jdn(*end) - self.to_jdn(*start)
+
+    def weekday(self, year: int, month: int, day: int) -> int:
+        """Return the weekday of a date; 0 is Monday, as ``date.weekday()``."""
+        return jdn_weekday(self.to_jdn(year, month, day))
+
+
+def jdn_weekday(jdn: int) -> int:
+    """Return the weekday of a JDN; 0 is Monday, as ``date.weekday()``."""
+    return jdn % 7
+
+
+class GregorianCalendar(Calendar):
+    """Proleptic Gregorian calendar, as used by ``datetime.date``."""
+
+    name = "gregorian"
+
+    def to_jdn(self, year: int, month: int, day: int) -> int:
+        return date(year, month, day).toordinal() + ORDINAL_TO_JDN
+
+    def from_jdn(self, jdn: int) -> DateTuple:
+        d = date.fromordinal(jdn - ORDINAL_TO_JDN)
+        return d.year, d.month, d.day
+
+
+class UmmAlQuraCalendar(Calendar):
+    """Umm al-Qura Hijri calendar backed by the month-start index.
+
+    Args:
+        index: Month-start index; defaults to the shared one.
+    """
+
+    name = "hijri"
+
+    def __init__(self, index: Optional[MonthStartIndex] = None):
+        self.index = index if index is not None else get_month_index()
+
+    def to_jdn(self, year: int, month: int, day: int) -> int:
+        return self.index.ordinal_from_hijri(year, month, day) + ORDINAL_TO_JDN
+
+    def from_jdn(self, jdn: int) -> DateTuple:
+        return self.index.hijri_from_ordinal(jdn - ORDINAL_TO_JDN)
+
+
+class KuwaitiCalendar(Calendar):
+    """Arithmetical Hijri calendar of the Kuwaiti algorithm, in exact integers.
+
+    Labels follow the original algorithm exactly, including the day-0 and
+    month-0 labels it gives to some month and year starts; ``to_jdn`` is
+    the inverse of ``from_jdn`` on every label it produces.
+    """
+
+    name = "kuwaiti"
+
+    def to_jdn(self, year: int, month: int, day: int) -> int:
+        if not 0 <= month <= 12 or not 0 <= day <= 30:
+            raise ValueError(f"Invalid Kuwaiti Hijri date: {year}-{month}-{day}")
+        # Start from the mean position and correct by the remaining
+        # difference; months are 29 or 30 days so this settles quickly.
+        cyc, j = divmod(year - 1, 30)
+        jdn = (KUWAITI_EPOCH + cyc * 10631
+               + (j * KUWAITI_IYEAR + KUWAITI_SHIFT) // KUWAITI_SCALE
+               + (month - 1) * 59 // 2 + day)
+        target = (year, month, day)
+        for _ in range(4):
+            got = self.from_jdn(jdn)
+            if got == target:
+                return jdn
+            jdn += ((year - got[0]) * 354 + (month - got[1]) * 29 + day - got[2]) or 1
+        raise ValueError(f"Invalid Kuwaiti Hijri date: {year}-{month}-{day}")
+
+    def from_jdn(self, jdn: int) -> DateTuple:
+        z = jdn - KUWAITI_EPOCH
+        cyc = z // 10631
+        z = (z - 10631 * cyc) * KUWAITI_SCALE
+        j = (z - KUWAITI_SHIFT) // KUWAITI_IYEAR
+        year = 30 * cyc + j
+        z -= j * KUWAITI_IYEAR + KUWAITI_SHIFT
+        month = (z + KUWAITI_MONTH_BIAS) // KUWAITI_MONTH
+        if month == 13:
+            month = 12
+        day = z // KUWAITI_SCALE - (295001 * month - 290000) // 10000
+        return year, month, day
+
+
+def kuwaiti_julian_day(year: int, month: int, day: int) -> int:
+    """Julian day of a Gregorian date as ``KuwaitiCalendarConverter`` computes it.
+
+    The formula was ported from JavaScript's zero-based months, so it runs
+    28-31 days ahead of the true JDN (and reads dates before the 1582
+    reform as Julian-calendar dates). It is kept only for exact
+    compatibility with ``convert_to_hijri``; use ``GREGORIAN.to_jdn`` for
+    the true Julian Day Number.
+    """
+    m = month + 1
+    y = year
+    if m < 3:
+        y -= 1
+        m += 12
+
+    if y < 1583:
+        b = 0
+        if y == 1582:
+            if m > 10:
+                b = -10
+            if m == 10 and day > 4:
+                b = -10
+    else:
+        a = y // 100
+        b = 2 - a + a // 4
+
+    # int(365.25 * n) and int(30.6001 * n) for positive n
+    return (1461 * (y + 4716)) // 4 + (306001 * (m + 1)) // 10000 + day + b - 1524
+
+
+GREGORIAN = GregorianCalendar()
+KUWAITI = KuwaitiCalendar()
@@ -0,0 +1,166 @@
+"""Precomputed Umm al-Qura month-start index."""
+
+from array import array
+from bisect import bisect_right
+from datetime import date
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+
+# Offset between hijridate's Reduced Julian Day numbers and proleptic
+# Gregorian ordinals (``date.toordinal()``).
+RJD_TO_ORDINAL = 2400000 - 1721425
+
+
+class MonthStartIndex:
+    """Sorted array of Umm al-Qura month starts as Gregorian ordinals.
+
+    Entry ``i`` is the ordinal of the first day of the ``i``-th supported
+    Hijri month, counted from ``month_offset`` months after the epoch. The
+    last entry marks the day after the final supported month, so every
+    month length is the difference between two neighbouring entries.
+    """
+
+    __slots__ = ('_starts', '_month_offset', '_base', '_min_ordinal', '_max_ordinal')
+
+    def __init__(self, starts: Sequence[int], month_offset: int):
+        if len(starts) < 2:
+            raise ValueError("Month-start index needs at least two entries")
+        self._starts = starts
+        self._month_offset = month_offset
+        self._base = month_offset + 13
+        self._min_ordinal = starts[0]
+        self._max_ordinal = starts[-1] - 1
+
+    @classmethod
+    def from_hijridate(cls) -> "MonthStartIndex":
+        """Build the index from hijridate's Umm al-Qura table."""
+        from hijridate import ummalqura
+
+        starts = array('l', (rjd + RJD_TO_ORDINAL for rjd in ummalqura.MONTH_STARTS))
+        return cls(starts, ummalqura.HIJRI_OFFSET)
+
+    @property
+    def min_ordinal(self) -> int:
+        """First supported Gregorian ordinal."""
+        return self._min_ordinal
+
+    @property
+    def max_ordinal(self) -> int:
+        """Last supported Gregorian ordinal."""
+        return self._max_ordinal
+
+    @property
+    def starts(self) -> Sequence[int]:
+        """The underlying month-start ordinals, including the end marker."""
+        return self._starts
+
+    @property
+    def month_offset(self) -> int:
+        """Hijri months elapsed before the first entry."""
+        return self._month_offset
+
+    @property
+    def hijri_range(self) -> Tuple[Tuple[int, int, int], Tuple[int, int, int]]:
+        """Inclusive supported Hijri range as ((y, m, d), (y, m, d))."""
+        return (
+            self.hijri_from_ordinal(self._min_ordinal),
+            self.hijri_from_ordinal(self._max_ordinal),
+        )
+
+    def month_length(self, year: int, month: int) -> int:
+        """Return the number of days in a Hijri month."""
+        index = self._month_index(year, month)
+        return self._starts[index + 1] - self._starts[index]
+
+    def month_lengths(self) -> bytes:
+        """Return the length of every supported Hijri month, in index order."""
+        starts = self._starts
+        return bytes(starts[i + 1] - starts[i] for i in range(len(starts) - 1))
+
+    def hijri_from_ordinal(self, ordinal: int) -> Tuple[int, int, int]:
+        """Convert a Gregorian ordinal to a Hijri (year, month, day) tuple."""
+        if not self._min_ordinal <= ordinal <= self._max_ordinal:
+            raise OverflowError(f"Ordinal {ordinal} is outside the supported range")
+        index = bisect_right(self._starts, ordinal) - 1
+        year, month = self.month_at(index)
+        return year, month, ordinal - self._starts[index] + 1
+
+    def ordinal_from_hijri(self, year: int, month: int, day: int) -> int:
+        """Convert a Hijri date to a Gregorian ordinal."""
+        index = self._month_index(year, month)
+        start = self._starts[index]
+        if not 1 <= day <= self._starts[index + 1] - start:
+            raise ValueError(f"Invalid Hijri day: {year}-{month}-{day}")
+        return start + day - 1
+
+    def hijri_from_ordinals(self, ordinals: Iterable[int]) -> List[Tuple[int, int, int]]:
+        """Convert many Gregorian ordinals without per-call method overhead.
+
+        Consecutive ordinals that fall in the same month as the previous one
+        skip the bisect, so sorted or clustered input is cheapest.
+        """
+        starts = self._starts
+        lo, hi = self._min_ordinal, self._max_ordinal
+        result = []
+        append = result.append
+        start = end = 0
+        year = month = 0
+        for ordinal in ordinals:
+            if not start <= ordinal < end:
+                if not lo <= ordinal <= hi:
+                    raise OverflowError(f"Ordinal {ordinal} is outside the supported range")
+                index = bisect_right(starts, ordinal) - 1
+                start, end = starts[index], starts[index + 1]
+                year, month = self.month_at(index)
+            append((year, month, ordinal - start + 1))
+        return result
+
+    def ordinals_from_hijri(self, dates: Iterable[Tuple[int, int, int]]) -> List[int]:
+        """Convert many Hijri (year, month, day) tuples to Gregorian ordinals."""
+        ordinal = self.ordinal_from_hijri
+        return [ordinal(year, month, day) for year, month, day in dates]
+
+    def to_hijri(self, year: int, month: int, day: int) -> Tuple[int, int, int]:
+        """Convert a Gregorian date to a Hijri (year, month, day) tuple."""
+        return self.hijri_from_ordinal(date(year, month, day).toordinal())
+
+    def to_gregorian(self, year: int, month: int, day: int) -> Tuple[int, int, int]:
+        """Convert a Hijri date to a Gregorian (year, month, day) tuple."""
+        gregorian = date.fromordinal(self.ordinal_from_hijri(year, month, day))
+        return gregorian.year, gregorian.month, gregorian.day
+
+    def month_position(self, year, month):
+        """Return the array position of a Hijri month's start, unchecked.
+
+        Works element-wise on NumPy arrays. Positions outside
+        ``0 <= position < len(starts) - 1`` are unsupported months.
+        """
+        return year * 12 + month - self._base
+
+    def month_at(self, position):
+        """Return the Hijri (year, month) starting at an array position.
+
+        The inverse of ``month_position``; also works on NumPy arrays.
+        """
+        years, month = divmod(position + self._month_offset, 12)
+        return years + 1, month + 1
+
+    def _month_index(self, year: int, month: int) -> int:
+        """Return the array position of a Hijri month's start."""
+        if not 1 <= month <= 12:
+            raise ValueError(f"Invalid Hijri month: {month}")
+        index = self.month_position(year, month)
+        if not 0 <= index < len(self._starts) - 1:
+            raise OverflowError(f"Hijri year {year} is outside the supported range")
+        return index
+
+
+_default_index: Optional[MonthStartIndex] = None
+
+
+def get_month_index() -> MonthStartIndex:
+    """Return the process-wide month-start index, building it on first use."""
+    global _default_index
+    if _default_index is None:
+        _default_index = MonthStartIndex.from_hijridate()
+    return _default_index
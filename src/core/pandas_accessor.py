@@ -0,0 +1,130 @@
+"""pandas ``Series.hijri`` accessor for vectorized Umm al-Qura conversion.
+
+Importing this module registers the accessor:
+
+    import src.core.pandas_accessor  # noqa: F401
+
+    df["due_date"].hijri.year                  # Int64 Hijri years
+    df["due_date"].hijri.to_frame()            # hijri_year/month/day columns
+    df["hijri_text"].hijri.to_gregorian()      # "1445-09-01" -> datetime64
+
+Only unique values are converted and the results are scattered back, so
+columns with many repeated dates are cheap. Nulls, NaT and dates outside
+the supported range become ``<NA>``/``NaT``.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .month_index import MonthStartIndex, get_month_index
+from .vectorized import (
+    ORDINAL_EPOCH_OFFSET, ummalqura_from_ordinals, ummalqura_to_ordinals,
+)
+
+
+def _nullable(values: np.ndarray, valid: np.ndarray, series: pd.Series, name: str) -> pd.Series:
+    """Wrap an int array as an Int64 Series with NA where not ``valid``."""
+    return pd.Series(pd.arrays.IntegerArray(values.astype(np.int64), ~valid),
+                     index=series.index, name=name)
+
+
+def hijri_to_gregorian(years, months, days,
+                       index: Optional[MonthStartIndex] = None) -> np.ndarray:
+    """Convert parallel Hijri year/month/day arrays to ``datetime64[D]``.
+
+    Invalid or unsupported dates become NaT.
+    """
+    index = index if index is not None else get_month_index()
+    ordinals, valid = ummalqura_to_ordinals(years, months, days, index)
+    result = (ordinals - ORDINAL_EPOCH_OFFSET).astype('datetime64[D]')
+    result[~valid] = np.datetime64('NaT')
+    return result
+
+
+@pd.api.extensions.register_series_accessor("hijri")
+class HijriAccessor:
+    """Hijri views of a datetime Series, and Hijri text to Gregorian."""
+
+    def __init__(self, series: pd.Series):
+        self._series = series
+        self._index = get_month_index()
+        self._parts: Optional[Tuple[np.ndarray, ...]] = None
+
+    def _components(self) -> Tuple[np.ndarray, ...]:
+        """Return (year, month, day, valid) arrays, computed once."""
+        if self._parts is None:
+            series = self._series
+            if not pd.api.types.is_datetime64_any_dtype(series.dtype):
+                raise AttributeError("hijri components need a datetime64 Series; "
+                                     "use .hijri.to_gregorian() for Hijri text")
+            values = series.dt.tz_localize(None) if series.dt.tz is not None else series
+            present = values.notna().to_numpy()
+            days = values.to_numpy(dtype='datetime64[ns]')[present].astype('datetime64[D]')
+            ordinals = days.astype(np.int64) + ORDINAL_EPOCH_OFFSET
+
+            unique, inverse = np.unique(ordinals, return_inverse=True)
+            parts = ummalqura_from_ordinals(unique, self._index)
+
+            n = len(series)
+            year, month, day = (np.zeros(n, dtype=np.int64) for _ in range(3))
+            valid = np.zeros(n, dtype=bool)
+            for out, part in zip((year, month, day, valid), parts):
+                out[present] = part[inverse]
+            self._parts = (year, month, day, valid)
+        return self._parts
+
+    @property
+    def year(self) -> pd.Series:
+        """Hijri year as a nullable Int64 Series."""
+        year, _, _, valid = self._components()
+        return _nullable(year, valid, self._series, self._series.name)
+
+    @property
+    def month(self) -> pd.Series:
+        """Hijri month as a nullable Int64 Series."""
+        _, month, _, valid = self._components()
+        return _nullable(month, valid, self._series, self._series.name)
+
+    @property
+    def day(self) -> pd.Series:
+        """Hijri day of month as a nullable Int64 Series."""
+        _, _, day, valid = self._components()
+        return _nullable(day, valid, self._series, self._series.name)
+
+    def to_frame(self, prefix: str = "hijri_") -> pd.DataFrame:
+        """Return a DataFrame with year, month and day columns."""
+        year, month, day, valid = self._components()
+        return pd.DataFrame({
+            f"{prefix}year": _nullable(year, valid, self._series, None),
+            f"{prefix}month": _nullable(month, valid, self._series, None),
+            f"{prefix}day": _nullable(day, valid, self._series, None),
+        }, index=self._series.index)
+
+    def to_gregorian(self) -> pd.Series:
+        """Convert Hijri ``YYYY-MM-DD`` (or ``DD/MM/YYYY``) text to datetime64.
+
+        Unparseable, invalid or unsupported values become NaT.
+        """
+        text = self._series.astype("string")
+        codes, unique = pd.factorize(text)  # missing values get code -1
+        unique = pd.Series(unique, dtype="string")
+
+        iso = unique.str.extract(r'^\s*(\d{1,4})-(\d{1,2})-(\d{1,2})\s*$')
+        dmy = unique.str.extract(r'^\s*(\d{1,2})/(\d{1,2})/(\d{1,4})\s*$')
+        years = iso[0].fillna(dmy[2])
+        months = iso[1].fillna(dmy[1])
+        days = iso[2].fillna(dmy[0])
+        parsed = years.notna().to_numpy()
+        converted = hijri_to_gregorian(
+            years.fillna("0").astype(np.int64), months.fillna("0").astype(np.int64),
+            days.fillna("0").astype(np.int64), self._index,
+        )
+        converted[~parsed] = np.datetime64('NaT')
+
+        result = np.full(len(codes), np.datetime64('NaT'), dtype='datetime64[D]')
+        present = codes >= 0
+        result[present] = converted[codes[present]]
+        return pd.Series(result.astype('datetime64[ns]'), index=self._series.index,
+                         name=self._series.name)
@@ -0,0 +1,102 @@
+"""Precompiled binary month-start table shared through the page cache.
+
+The file holds a 16-byte header followed by the month-start ordinals as
+little-endian 32-bit integers. Loading maps it read-only, so every process
+that uses the same file shares one copy in memory.
+
+Build a table with:
+    python -m src.core.table_file build calendar.tbl
+"""
+
+from array import array
+from typing import Dict, Optional
+import argparse
+import mmap
+import struct
+import sys
+
+from .month_index import MonthStartIndex, get_month_index
+
+
+MAGIC = b'HJMS'
+VERSION = 1
+HEADER = struct.Struct('<4sHHii')  # magic, version, reserved, month_offset, count
+
+_loaded: Dict[str, MonthStartIndex] = {}
+
+
+def build_table(path: str, index: Optional[MonthStartIndex] = None) -> int:
+    """Write ``index`` (default: the shared one) to ``path``; return bytes written."""
+    index = index if index is not None else get_month_index()
+    starts = array('i', _starts_of(index))
+    if sys.byteorder != 'little':
+        starts.byteswap()
+    header = HEADER.pack(MAGIC, VERSION, 0, index.month_offset, len(starts))
+    with open(path, 'wb') as f:
+        f.write(header)
+        f.write(starts.tobytes())
+    return HEADER.size + len(starts) * starts.itemsize
+
+
+def load_table(path: str) -> MonthStartIndex:
+    """Map a table file read-only and return an index over it.
+
+    Each path is mapped once per process; later calls return the same index.
+    """
+    index = _loaded.get(path)
+    if index is not None:
+        return index
+
+    with open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(mapped) < HEADER.size:
+        raise ValueError(f"Calendar table too short: {path}")
+    magic, version, _, month_offset, count = HEADER.unpack_from(mapped)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Not a version {VERSION} calendar table: {path}")
+    if len(mapped) != HEADER.size + count * 4:
+        raise ValueError(f"Calendar table size does not match its header: {path}")
+
+    body = memoryview(mapped)[HEADER.size:]
+    if sys.byteorder == 'little':
+        starts = body.cast('i')
+    else:
+        starts = array('i', body.tobytes())
+        starts.byteswap()
+
+    index = MonthStartIndex(starts, month_offset)
+    _loaded[path] = index
+    return index
+
+
+def _starts_of(index: MonthStartIndex):
+    """Yield every month-start ordinal of ``index``, including the end marker."""
+    ordinal = index.min_ordinal
+    yield ordinal
+    for length in index.month_lengths():
+        ordinal += length
+        yield ordinal
+
+
+def main(argv=None):
+    """Command-line entry point for building and inspecting tables."""
+    parser = argparse.ArgumentParser(prog="python -m src.core.table_file")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="write the Umm al-Qura table")
+    build.add_argument("path")
+    info = commands.add_parser("info", help="describe a table file")
+    info.add_argument("path")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        size = build_table(args.path)
+        print(f"Wrote {size} bytes to {args.path}")
+    else:
+        index = load_table(args.path)
+        first, last = index.hijri_range
+        print(f"{args.path}: Hijri {first} - {last}, "
+              f"ordinals {index.min_ordinal}-{index.max_ordinal}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Date text and CSV streaming helpers shared by the CLI and services.
+
+``parse_date``/``format_date`` define the text forms accepted and written
+by every headless entry point (CLI, HTTP service, daemon, SQLite
+functions); ``convert_stream`` converts a CSV date column in bounded
+memory.
+"""
+
+from itertools import islice
+from typing import Iterator, List, Optional, TextIO, Tuple
+import csv
+
+from ..config.settings import CalendarType
+from .calendar_converter import CalendarConverter, ErrorPolicy, HijriGregorianConverter
+
+
+def parse_date(text: str) -> Optional[Tuple[int, int, int]]:
+    """Parse ``YYYY-MM-DD`` or ``DD/MM/YYYY`` into (day, month, year).
+
+    Returns None when the text is not a date.
+    """
+    text = text.strip()
+    try:
+        if '-' in text:
+            year, month, day = text.split('-')
+        else:
+            day, month, year = text.split('/')
+        return int(day), int(month), int(year)
+    except ValueError:
+        return None
+
+
+def format_date(result) -> str:
+    """Format a conversion result as ``YYYY-MM-DD``."""
+    return f"{result.year:04d}-{result.month:02d}-{result.day:02d}"
+
+
+def convert_stream(infile: TextIO, outfile: TextIO, column: str,
+                   target: CalendarType, out_column: Optional[str] = None,
+                   chunk_size: int = 10000,
+                   on_error: ErrorPolicy = ErrorPolicy.SENTINEL,
+                   delimiter: str = ',',
+                   converter: Optional[CalendarConverter] = None) -> Tuple[int, int]:
+    """Convert one CSV column chunk by chunk, appending the result column.
+
+    Memory use is bounded by ``chunk_size`` rows. Rows that fail to convert
+    get an empty cell under ``SENTINEL``, are dropped under ``SKIP``, and
+    stop the run under ``RAISE``.
+
+    Returns:
+        (rows written, rows that failed to convert)
+    """
+    converter = converter if converter is not None else HijriGregorianConverter(use_index=True)
+    convert_many = (converter.to_hijri_many if target is CalendarType.HIJRI
+                    else converter.to_gregorian_many)
+    out_column = out_column or f"{column}_{target.value}"
+
+    reader = csv.reader(infile, delimiter=delimiter)
+    writer = csv.writer(outfile, delimiter=delimiter, lineterminator='\n')
+    header = next(reader, None)
+    if header is None:
+        return 0, 0
+    try:
+        position = header.index(column)
+    except ValueError:
+        raise ValueError(f"Column {column!r} not found in header: {header}") from None
+    writer.writerow(header + [out_column])
+
+    written = failed = 0
+    for chunk in _chunks(reader, chunk_size):
+        dates = [parse_date(row[position]) if len(row) > position else None
+                 for row in chunk]
+        errors: List = []
+        results = list(convert_many(dates, on_error=ErrorPolicy.SENTINEL, errors=errors))
+        failed += len(errors)
+        if errors and on_error is ErrorPolicy.RAISE:
+            row = chunk[errors[0].index]
+            cell = row[position] if len(row) > position else ""
+            raise ValueError(f"Row {written + errors[0].index + 1}: cannot convert {cell!r}")
+        for row, result in zip(chunk, results):
+            if result is None:
+                if on_error is ErrorPolicy.SKIP:
+                    continue
+                row.append("")
+            else:
+                row.append(format_date(result))
+            writer.writerow(row)
+            written += 1
+    return written, failed
+
+
+def _chunks(rows: Iterator[list], size: int) -> Iterator[List[list]]:
+    """Yield lists of up to ``size`` rows."""
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
@@ -0,0 +1,164 @@
+"""Table-driven date validation for each supported calendar.
+
+Validators answer with a bool and never raise or log, so they are safe to
+call on every row of a bulk load. The ``mask`` variants validate NumPy
+arrays at once, and ``error`` builds the exception that explains a
+rejected date.
+"""
+
+from datetime import date
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from .month_index import MonthStartIndex, get_month_index
+from .vectorized import _numpy, ummalqura_to_ordinals
+
+if TYPE_CHECKING:
+    import numpy
+
+
+_GREGORIAN_MONTH_DAYS = bytes((0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31))
+
+
+class OutOfRangeError(ValueError):
+    """A real date outside the range the conversion tables cover.
+
+    Args:
+        message: Error text.
+        first: First supported date, as ``YYYY-MM-DD``.
+        last: Last supported date, as ``YYYY-MM-DD``.
+    """
+
+    def __init__(self, message: str, first: str, last: str):
+        super().__init__(message)
+        self.first = first
+        self.last = last
+
+
+def _iso(year: int, month: int, day: int) -> str:
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+
+class HijriValidator:
+    """Validate Umm al-Qura dates against the month-start index.
+
+    Lookups go straight to the index, so a memory-mapped table (see
+    ``table_file``) stays shared instead of being copied per validator.
+
+    Args:
+        index: Month-start index; defaults to the shared one.
+    """
+
+    def __init__(self, index: Optional[MonthStartIndex] = None):
+        self._index = index if index is not None else get_month_index()
+
+    def is_valid(self, year: int, month: int, day: int) -> bool:
+        """Return True if the date exists within the supported Hijri range."""
+        try:
+            self._index.ordinal_from_hijri(year, month, day)
+        except (ValueError, TypeError, OverflowError):
+            return False
+        return True
+
+    __call__ = is_valid
+
+    def exists(self, year: int, month: int, day: int) -> bool:
+        """Return True if the date can exist, even outside the supported range.
+
+        Month lengths beyond the table are unknown, so any day 1-30 counts.
+        """
+        try:
+            self._index.ordinal_from_hijri(year, month, day)
+        except OverflowError:  # raised only after the month was checked
+            return isinstance(day, int) and 1 <= day <= 30
+        except (ValueError, TypeError):
+            return False
+        return True
+
+    @property
+    def supported_range(self) -> Tuple[Tuple[int, int, int], Tuple[int, int, int]]:
+        """Inclusive supported range as ((y, m, d), (y, m, d))."""
+        return self._index.hijri_range
+
+    def error(self, year: int, month: int, day: int) -> ValueError:
+        """Return the exception for a date that ``is_valid`` rejects."""
+        if self.exists(year, month, day):
+            first, last = (_iso(*bound) for bound in self.supported_range)
+            return OutOfRangeError(f"Hijri date {year}-{month}-{day} is outside the "
+                                   f"supported range {first}..{last}", first, last)
+        return ValueError(f"Invalid Hijri date: {year}-{month}-{day}")
+
+    def month_length(self, year: int, month: int) -> int:
+        """Return the month's length in days, or 0 if it is unsupported."""
+        try:
+            return self._index.month_length(year, month)
+        except (ValueError, TypeError, OverflowError):
+            return 0
+
+    def mask(self, years, months, days) -> "numpy.ndarray":
+        """Return a boolean array marking valid dates in parallel arrays."""
+        return ummalqura_to_ordinals(years, months, days, self._index)[1]
+
+
+class GregorianValidator:
+    """Validate Gregorian dates with a month-length table.
+
+    Args:
+        index: Month-start index whose range bounds the valid dates.
+        supported_only: Also reject dates outside the index's range.
+    """
+
+    def __init__(self, index: Optional[MonthStartIndex] = None,
+                 supported_only: bool = True):
+        if supported_only:
+            index = index if index is not None else get_month_index()
+            first = date.fromordinal(index.min_ordinal)
+            last = date.fromordinal(index.max_ordinal)
+        else:
+            first, last = date.min, date.max
+        self._min = (first.year, first.month, first.day)
+        self._max = (last.year, last.month, last.day)
+
+    def is_valid(self, year: int, month: int, day: int) -> bool:
+        """Return True if the date exists and is within range."""
+        return (self.exists(year, month, day)
+                and self._min <= (year, month, day) <= self._max)
+
+    __call__ = is_valid
+
+    def exists(self, year: int, month: int, day: int) -> bool:
+        """Return True if the date exists, whatever the supported range."""
+        try:
+            if not 1 <= month <= 12 or day < 1:
+                return False
+            if day > _GREGORIAN_MONTH_DAYS[month]:
+                return (month == 2 and day == 29 and year % 4 == 0
+                        and (year % 100 != 0 or year % 400 == 0))
+            return isinstance(year, int)
+        except TypeError:
+            return False
+
+    @property
+    def supported_range(self) -> Tuple[Tuple[int, int, int], Tuple[int, int, int]]:
+        """Inclusive supported range as ((y, m, d), (y, m, d))."""
+        return self._min, self._max
+
+    def error(self, year: int, month: int, day: int) -> ValueError:
+        """Return the exception for a date that ``is_valid`` rejects."""
+        if self.exists(year, month, day):
+            first, last = (_iso(*bound) for bound in self.supported_range)
+            return OutOfRangeError(f"Gregorian date {year}-{month}-{day} is outside the "
+                                   f"supported range {first}..{last}", first, last)
+        return ValueError(f"Invalid Gregorian date: {year}-{month}-{day}")
+
+    def mask(self, years, months, days) -> "numpy.ndarray":
+        """Return a boolean array marking valid dates in parallel arrays."""
+        np = _numpy()
+        years, months, days = (np.asarray(a, dtype=np.int64) for a in (years, months, days))
+        table = np.frombuffer(_GREGORIAN_MONTH_DAYS, dtype=np.uint8).astype(np.int64)
+        ok = (months >= 1) & (months <= 12)
+        leap = (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+        length = table[np.clip(months, 0, 12)] + (leap & (months == 2))
+        key = years * 10000 + months * 100 + days
+        low = self._min[0] * 10000 + self._min[1] * 100 + self._min[2]
+        high = self._max[0] * 10000 + self._max[1] * 100 + self._max[2]
+        return ok & (days >= 1) & (days <= length) & (key >= low) & (key <= high)
@@ -0,0 +1,157 @@
+"""NumPy kernels for converting whole arrays of dates at once.
+
+NumPy is an optional dependency; it is imported on first use so the rest
+of the package keeps working without it.
+"""
+
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    import numpy
+
+
+# Fixed-point scale for the Kuwaiti algorithm's fractional constants.
+# 30000 is the smallest unit that makes 10631/30, 8.01/60, 28.5001, 29.5
+# and 29.5001 exact integers.
+KUWAITI_SCALE = 30000
+KUWAITI_IYEAR = 10631 * 1000          # 10631 / 30 days
+KUWAITI_SHIFT = 4005                  # 8.01 / 60 days
+KUWAITI_MONTH_BIAS = 855003           # 28.5001 days
+KUWAITI_MONTH = 885000                # 29.5 days
+KUWAITI_EPOCH = 1948084
+
+# Days between 0001-01-01 (ordinal 1) and 1970-01-01 (datetime64 zero).
+ORDINAL_EPOCH_OFFSET = 719163
+
+
+class HijriArrays(NamedTuple):
+    """Parallel arrays of Hijri dates.
+
+    ``weekday`` uses the Kuwaiti algorithm's numbering: 1 is Ahad (Sunday)
+    through 7 for Sabt (Saturday).
+    """
+    year: "numpy.ndarray"
+    month: "numpy.ndarray"
+    day: "numpy.ndarray"
+    weekday: "numpy.ndarray"
+
+
+def _numpy():
+    """Import NumPy or raise a helpful error."""
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "Batch conversion requires NumPy: pip install hijri-date-converter[batch]"
+        ) from e
+    return numpy
+
+
+def to_ordinals(values) -> "numpy.ndarray":
+    """Return proleptic Gregorian ordinals for integer or ``datetime64`` input."""
+    np = _numpy()
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.datetime64):
+        days = values.astype('datetime64[D]').astype(np.int64)
+        return days + ORDINAL_EPOCH_OFFSET
+    if not np.issubdtype(values.dtype, np.integer):
+        raise TypeError(f"Expected integer ordinals or datetime64 values, got {values.dtype}")
+    return values.astype(np.int64, copy=False)
+
+
+def civil_from_ordinals(ordinals):
+    """Split Gregorian ordinals into (year, month, day) arrays."""
+    np = _numpy()
+    z = np.asarray(ordinals, dtype=np.int64) - ORDINAL_EPOCH_OFFSET + 719468
+    era = z // 146097
+    doe = z - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    day = doy - (153 * mp + 2) // 5 + 1
+    month = np.where(mp < 10, mp + 3, mp - 9)
+    year = yoe + era * 400 + (month <= 2)
+    return year, month, day
+
+
+def kuwaiti_to_hijri(values) -> HijriArrays:
+    """Vectorized Kuwaiti algorithm over Gregorian ordinals or ``datetime64``.
+
+    Mirrors ``KuwaitiCalendarConverter.convert_to_hijri`` step for step,
+    including its Julian-calendar handling before the 1582 reform, but with
+    every fractional constant scaled to an exact integer.
+    """
+    np = _numpy()
+    year, month, day = civil_from_ordinals(to_ordinals(values))
+
+    m = month + 1
+    y = year.copy()
+    early = m < 3
+    y[early] -= 1
+    m[early] += 12
+
+    a = y // 100
+    b = 2 - a + a // 4
+    b[y < 1583] = 0
+    reform = y == 1582
+    b[reform & (m > 10)] = -10
+    october = reform & (m == 10)
+    b[october] = np.where(day[october] > 4, -10, 0)
+
+    # int(365.25 * n) and int(30.6001 * n) for the positive n used here.
+    jd = (1461 * (y + 4716)) // 4 + (306001 * (m + 1)) // 10000 + day + b - 1524
+
+    weekday = (jd + 1) % 7 + 1
+
+    z = jd - KUWAITI_EPOCH
+    cyc = z // 10631
+    z = (z - 10631 * cyc) * KUWAITI_SCALE
+    j = (z - KUWAITI_SHIFT) // KUWAITI_IYEAR
+    hijri_year = 30 * cyc + j
+    z = z - j * KUWAITI_IYEAR - KUWAITI_SHIFT
+    hijri_month = np.minimum((z + KUWAITI_MONTH_BIAS) // KUWAITI_MONTH, 12)
+    # int(29.5001 * im - 29), positive for every month 1-12.
+    offset = (295001 * hijri_month - 290000) // 10000
+    hijri_day = (z - offset * KUWAITI_SCALE) // KUWAITI_SCALE
+
+    return HijriArrays(hijri_year, hijri_month, hijri_day, weekday)
+
+
+def ummalqura_from_ordinals(ordinals, index):
+    """Vectorized Umm al-Qura lookup for Gregorian ordinals.
+
+    Args:
+        ordinals: Integer array of proleptic Gregorian ordinals.
+        index: ``MonthStartIndex`` to search.
+
+    Returns:
+        (year, month, day, valid) arrays; entries outside the supported
+        range are marked invalid and hold zeros.
+    """
+    np = _numpy()
+    ordinals = np.asarray(ordinals, dtype=np.int64)
+    starts = np.asarray(index.starts, dtype=np.int64)
+    valid = (ordinals >= index.min_ordinal) & (ordinals <= index.max_ordinal)
+    position = np.clip(np.searchsorted(starts, ordinals, side='right') - 1,
+                       0, len(starts) - 2)
+    years, months = index.month_at(position)
+    day = ordinals - starts[position] + 1
+    zero = np.zeros_like(ordinals)
+    return (np.where(valid, years, zero), np.where(valid, months, zero),
+            np.where(valid, day, zero), valid)
+
+
+def ummalqura_to_ordinals(years, months, days, index):
+    """Vectorized Umm al-Qura dates to Gregorian ordinals.
+
+    Returns:
+        (ordinals, valid) arrays; invalid or unsupported dates hold zero.
+    """
+    np = _numpy()
+    years, months, days = (np.asarray(a, dtype=np.int64) for a in (years, months, days))
+    starts = np.asarray(index.starts, dtype=np.int64)
+    position = index.month_position(years, months)
+    valid = (months >= 1) & (months <= 12) & (position >= 0) & (position < len(starts) - 1)
+    safe = np.where(valid, position, 0)
+    valid &= (days >= 1) & (days <= starts[safe + 1] - starts[safe])
+    return np.where(valid, starts[safe] + days - 1, 0), valid
@@ -0,0 +1,166 @@
+"""Long-lived line-protocol conversion daemon.
+
+Keeps a warm converter and result cache in one process so shell and cron
+jobs do not pay interpreter startup and hijridate import per date. Each
+request is one line; each gets exactly one response line:
+
+    hijri 2024-03-11                  -> 1445-09-01
+    gregorian 1445-09-01 1445-10-01   -> 2024-03-11 2024-04-10
+    hijri 2024-02-30                  -> -            (date could not be converted)
+    ping                              -> pong
+    stats                             -> hits=... misses=... size=...
+    anything else                     -> ERR <message>
+
+Dates are ``YYYY-MM-DD`` or ``DD/MM/YYYY``. The daemon listens on a Unix
+domain socket, or speaks the same protocol over stdin/stdout.
+
+Run with:
+    hijri-converter daemon --socket /tmp/hijri-converter.sock
+"""
+
+from typing import Optional, TextIO
+import asyncio
+import logging
+import os
+import socket
+import stat
+
+from .config.settings import CalendarType
+from .core.calendar_converter import CachedConverter, CalendarConverter, HijriGregorianConverter
+from .core.text_io import format_date, parse_date
+from .daemon_client import DEFAULT_SOCKET
+
+
+logger = logging.getLogger(__name__)
+
+FAILED = "-"
+
+
+class LineProtocolDaemon:
+    """Answers newline-delimited conversion requests.
+
+    Args:
+        converter: Converter to keep warm (default: cached, index-backed
+            ``HijriGregorianConverter``).
+    """
+
+    def __init__(self, converter: Optional[CalendarConverter] = None):
+        self.converter = converter if converter is not None else CachedConverter(
+            HijriGregorianConverter(use_index=True))
+        self.path: Optional[str] = None
+        self._server: Optional[asyncio.base_events.Server] = None
+
+    def handle_line(self, line: str) -> str:
+        """Return the response line (without newline) for one request line."""
+        command, *dates = line.split() or [""]
+        command = command.lower()
+        if command == "ping":
+            return "pong"
+        if command == "stats":
+            return self._stats()
+        if command == CalendarType.HIJRI.value:
+            convert_many = self.converter.to_hijri_many
+        elif command == CalendarType.GREGORIAN.value:
+            convert_many = self.converter.to_gregorian_many
+        else:
+            return f"ERR unknown command {command!r}; expected hijri, gregorian, ping or stats"
+        if not dates:
+            return "ERR no dates given"
+        results = convert_many([parse_date(d) for d in dates])
+        return " ".join(FAILED if r is None else format_date(r) for r in results)
+
+    def _stats(self) -> str:
+        """Describe the result cache, if the converter has one."""
+        cache_info = getattr(self.converter, "cache_info", None)
+        if cache_info is None:
+            return "ERR converter has no cache"
+        info = cache_info()
+        return (f"hits={info.hits} misses={info.misses} size={info.currsize} "
+                f"hit_rate={info.hit_rate:.3f}")
+
+    def serve_stdio(self, infile: TextIO, outfile: TextIO):
+        """Answer requests from ``infile`` until end of input."""
+        for line in infile:
+            if line.strip():
+                outfile.write(self.handle_line(line) + "\n")
+                outfile.flush()
+
+    async def start(self, path: str = DEFAULT_SOCKET):
+        """Listen on the Unix socket at ``path``, replacing a stale socket file.
+
+        Raises FileExistsError if ``path`` is not a socket or another daemon
+        is listening on it. The socket is created owner-only (mode 0600).
+        """
+        _remove_stale_socket(path)
+        umask = os.umask(0o177)
+        try:
+            self._server = await asyncio.start_unix_server(self._handle, path)
+        finally:
+            os.umask(umask)
+        self.path = path
+        logger.info(f"Listening on {path}")
+
+    async def serve_forever(self, path: str = DEFAULT_SOCKET):
+        """Start if needed and serve until cancelled, then remove the socket."""
+        if self._server is None:
+            await self.start(path)
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self):
+        """Stop listening and remove the socket file."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+            if self.path is not None and os.path.exists(self.path):
+                os.unlink(self.path)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Answer every line of one connection."""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                text = line.decode("utf-8", errors="replace")
+                if text.strip():
+                    writer.write((self.handle_line(text) + "\n").encode("utf-8"))
+                    await writer.drain()
+        except ValueError:
+            # StreamReader raises ValueError for lines over its 64 KiB limit.
+            writer.write(b"ERR request line too long\n")
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+def _remove_stale_socket(path: str):
+    """Unlink ``path`` if it is a socket that nobody accepts connections on."""
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"{path} exists and is not a socket")
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except (ConnectionRefusedError, FileNotFoundError):
+        os.unlink(path)  # left behind by a daemon that exited uncleanly
+        return
+    finally:
+        probe.close()
+    raise FileExistsError(f"A daemon is already listening on {path}")
+
+
+def run(path: str = DEFAULT_SOCKET):
+    """Serve on a Unix socket until interrupted."""
+    daemon = LineProtocolDaemon()
+    try:
+        asyncio.run(daemon.serve_forever(path))
+    except KeyboardInterrupt:
+        pass
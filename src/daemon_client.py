@@ -0,0 +1,63 @@
+"""Tiny client for the conversion daemon (see ``daemon``).
+
+Standard library only and nothing else from the package is imported, so
+each call costs little more than interpreter startup.
+
+Examples:
+    python -m src.daemon_client hijri 2024-03-11
+    printf 'hijri 2024-03-11\\ngregorian 1445-09-01\\n' | python -m src.daemon_client
+"""
+
+from typing import Iterable, List, Optional
+import argparse
+import os
+import sys
+
+
+DEFAULT_SOCKET = os.environ.get("HIJRI_CONVERTER_SOCKET", "/tmp/hijri-converter.sock")
+
+
+def query(lines: Iterable[str], path: str = DEFAULT_SOCKET, timeout: float = 5.0) -> List[str]:
+    """Send request lines over one connection and return the response lines."""
+    # The daemon ignores blank lines, so they must not be counted as requests.
+    payload = "".join(line.strip() + "\n" for line in lines if line.strip()).encode("utf-8")
+    expected = payload.count(b"\n")
+    import socket  # Deferred so the CLI can read DEFAULT_SOCKET cheaply
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(path)
+        sock.sendall(payload)
+        sock.shutdown(socket.SHUT_WR)
+        data = bytearray()
+        while data.count(b"\n") < expected:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            data += chunk
+    return data.decode("utf-8").splitlines()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Print the daemon's answers; exit 1 if any request failed."""
+    parser = argparse.ArgumentParser(prog="hijri-converter-client",
+                                     description="Query a running conversion daemon.")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help="daemon socket path")
+    parser.add_argument("request", nargs="*",
+                        help="one request, e.g. 'hijri 2024-03-11' (default: lines from stdin)")
+    args = parser.parse_args(argv)
+
+    lines = [" ".join(args.request)] if args.request else sys.stdin.read().splitlines()
+    lines = [line for line in lines if line.strip()]
+    try:
+        answers = query(lines, args.socket)
+    except OSError as e:
+        print(f"Cannot reach daemon at {args.socket}: {e}", file=sys.stderr)
+        return 2
+    for answer in answers:
+        print(answer)
+    failed = any(a.startswith("ERR") or "-" in a.split() for a in answers)
+    return 1 if failed or len(answers) < len(lines) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""File-backed translation catalogs, loaded per language on first use.
+
+Each language has one JSON catalog in ``catalogs/<code>.json`` with its
+month names, weekdays (Monday first), UI text and a template for the
+numbered month labels. A catalog is read the first time its language is
+needed and then shared by every ``Translator`` in the process, so unused
+languages cost neither import time nor memory.
+
+Adding a language means adding a ``Language`` member and its catalog file.
+"""
+
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+import json
+import threading
+
+from ..config.settings import CalendarType, Language
+
+
+CATALOG_DIR = Path(__file__).with_name("catalogs")
+
+
+class Catalog:
+    """Translations for one language.
+
+    Numbered month labels (``"9 - Ramadan"``) are not stored; they are
+    built from the catalog's template the first time they are asked for.
+    """
+
+    __slots__ = ("language", "gregorian_months", "hijri_months", "weekdays",
+                 "ui_text", "_templates", "_numbered")
+
+    def __init__(self, language: Language, data: dict):
+        self.language = language
+        self.gregorian_months: Tuple[str, ...] = tuple(data["gregorian_months"])
+        self.hijri_months: Tuple[str, ...] = tuple(data["hijri_months"])
+        self.weekdays: Tuple[str, ...] = tuple(data["weekdays"])
+        self.ui_text: Dict[str, str] = data["ui_text"]
+        self._templates = {
+            CalendarType.GREGORIAN: data["gregorian_months_numbered"],
+            CalendarType.HIJRI: data["hijri_months_numbered"],
+        }
+        self._numbered: Dict[CalendarType, Tuple[str, ...]] = {}
+
+    def months(self, calendar: CalendarType) -> Tuple[str, ...]:
+        """Month names of ``calendar``, January/Muharram first."""
+        return self.hijri_months if calendar is CalendarType.HIJRI else self.gregorian_months
+
+    def numbered_months(self, calendar: CalendarType) -> Tuple[str, ...]:
+        """Numbered month labels of ``calendar``, derived on first use."""
+        numbered = self._numbered.get(calendar)
+        if numbered is None:
+            template = self._templates[calendar]
+            numbered = tuple(template.format(number=number, name=name)
+                             for number, name in enumerate(self.months(calendar), 1))
+            self._numbered[calendar] = numbered
+        return numbered
+
+
+_catalogs: Dict[Language, Catalog] = {}
+_lock = threading.Lock()
+
+
+def catalog_path(language: Language) -> Path:
+    """Path of a language's catalog file."""
+    return CATALOG_DIR / f"{language.value}.json"
+
+
+def load_catalog(language: Language, path: Optional[Path] = None) -> Catalog:
+    """Return the catalog for ``language``, reading its file on first use."""
+    catalog = _catalogs.get(language)
+    if catalog is not None:
+        return catalog
+    with _lock:
+        catalog = _catalogs.get(language)
+        if catalog is None:
+            with open(path or catalog_path(language), encoding="utf-8") as f:
+                catalog = Catalog(language, json.load(f))
+            _catalogs[language] = catalog
+        return catalog
+
+
+def loaded_languages() -> Tuple[Language, ...]:
+    """Languages whose catalogs have been read in this process."""
+    return tuple(_catalogs)
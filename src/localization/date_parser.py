@@ -0,0 +1,270 @@
+"""Parser for free-text dates in any supported language.
+
+Month names from ``TranslationData`` for every language, plus common
+transliteration and regional variants, are folded (case, diacritics,
+hamza forms, the Arabic article, punctuation) and compiled once into
+dictionaries, so each lookup is a single hash probe. Arabic-Indic and
+Persian digits are accepted anywhere.
+
+    >>> parser = get_date_parser()
+    >>> parser.parse("١٤٤٥/٠٩/٠١")
+    ParsedDate(calendar=<CalendarType.HIJRI: 'hijri'>, year=1445, month=9, day=1)
+    >>> parser.parse("1 Ramaḍān 1445")
+    ParsedDate(calendar=<CalendarType.HIJRI: 'hijri'>, year=1445, month=9, day=1)
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+import re
+import unicodedata
+
+from ..config.settings import CalendarType, Language
+from .translations import TranslationData
+
+
+# Arabic-Indic (U+0660) and extended/Persian (U+06F0) digits to ASCII.
+DIGITS = str.maketrans("٠١٢٣٤٥٦٧٨٩۰۱۲۳۴۵۶۷۸۹", "01234567890123456789")
+
+# Hijri years below this are assumed when a numeric date has no era marker.
+HIJRI_YEAR_LIMIT = 1600
+
+HIJRI_MONTH_VARIANTS: Dict[int, Tuple[str, ...]] = {
+    1: ("Muharram", "Moharram", "Muharam", "Al-Muharram"),
+    2: ("Safar", "Safer", "Safar al-Muzaffar"),
+    3: ("Rabi al-Awwal", "Rabi ul Awwal", "Rabiul Awwal", "Rabi al-Awal", "Rabi I",
+        "ربيع الأول"),
+    4: ("Rabi al-Thani", "Rabi ath-Thani", "Rabi al-Akhir", "Rabi ul Akhir", "Rabi al-Sani",
+        "Rabi us Sani", "Rabi II", "ربيع الثاني", "ربيع الآخر", "ربيع آخر"),
+    5: ("Jumada al-Ula", "Jumada al-Oula", "Jumada al-Awwal", "Jumada al-Uwla",
+        "Jumadi ul Awwal", "Jumada I", "جمادى الأول", "جمادى أولى"),
+    6: ("Jumada al-Akhirah", "Jumada al-Akhira", "Jumada al-Thani", "Jumadi us Sani",
+        "Jumada II", "جمادى الثاني", "جمادى الثانية", "جمادى آخرة"),
+    7: ("Rajab", "Rajjab", "Rajab al-Murajab"),
+    8: ("Shaban", "Shaaban", "Sha'ban", "Shabaan"),
+    9: ("Ramadan", "Ramadhan", "Ramazan", "Ramzan", "Ramadaan"),
+    10: ("Shawwal", "Shawal", "Shawaal"),
+    11: ("Dhu al-Qadah", "Dhul Qadah", "Dhu al-Qidah", "Dhul Qidah", "Dhu'l-Qa'dah",
+         "Zul Qadah", "Zulqadah", "Thul Qadah", "Dhu al-Qaada", "ذي القعدة"),
+    12: ("Dhu al-Hijjah", "Dhul Hijjah", "Dhu'l-Hijjah", "Zul Hijjah", "Zulhijjah",
+         "Thul Hijjah", "Dhil Hijjah", "ذي الحجة"),
+}
+
+GREGORIAN_MONTH_VARIANTS: Dict[int, Tuple[str, ...]] = {
+    1: ("Jan", "كانون الثاني", "جانفي"),
+    2: ("Feb", "شباط", "فيفري"),
+    3: ("Mar", "آذار"),
+    4: ("Apr", "نيسان", "إبريل", "أفريل"),
+    5: ("أيار", "ماي"),
+    6: ("Jun", "حزيران", "يونيه", "جوان"),
+    7: ("Jul", "تموز", "يوليه", "جويلية"),
+    8: ("Aug", "آب", "أوت"),
+    9: ("Sep", "Sept", "أيلول"),
+    10: ("Oct", "تشرين الأول"),
+    11: ("Nov", "تشرين الثاني"),
+    12: ("Dec", "كانون الأول", "ديسمبر"),
+}
+
+# Words that mark the calendar; everything here is skipped when looking
+# up the month name.
+ERA_MARKERS: Dict[CalendarType, Tuple[str, ...]] = {
+    CalendarType.HIJRI: ("هـ", "ه", "هجري", "هجرية", "AH", "H", "Hijri", "Hijrah",
+                         "히즈라력", "히즈리", "히즈라"),
+    CalendarType.GREGORIAN: ("م", "ميلادي", "ميلادية", "AD", "CE", "Gregorian",
+                             "서기", "그레고리력"),
+}
+
+# Korean unit suffixes after numbers: 1445년 9월 1일.
+KOREAN_UNITS = {"년": "year", "월": "month", "일": "day"}
+
+_NUMERIC = re.compile(r"\s*(\d{1,4})\s*([-/.])\s*(\d{1,2})\s*\2\s*(\d{1,4})\s*(\D*)")
+_NUMBER = re.compile(r"(\d+)\s*([년월일])?")
+_WORD_SPLIT = re.compile(r"[\s,،/()\[\]]+")
+_STRIP = str.maketrans("", "", "ʿʾ'’‘`ـ-_.")
+_ARABIC_FOLD = str.maketrans("ةى", "هي")
+
+
+class ParsedDate(NamedTuple):
+    """A parsed date; ``day`` is None for month-and-year text."""
+    calendar: CalendarType
+    year: int
+    month: int
+    day: Optional[int]
+
+
+def fold(word: str) -> str:
+    """Fold one word for lookup: case, diacritics, hamza, article, punctuation."""
+    word = unicodedata.normalize("NFKD", word.casefold())
+    word = "".join(c for c in word if not unicodedata.combining(c))
+    word = word.translate(_STRIP).translate(_ARABIC_FOLD)
+    if word.startswith("ال") and len(word) > 3:
+        word = word[2:]
+    if word.endswith("ah") and len(word) > 3:
+        word = word[:-1]
+    return word
+
+
+def fold_phrase(text: str) -> str:
+    """Fold every word of a phrase and join them without separators."""
+    return "".join(fold(w) for w in _WORD_SPLIT.split(text) if w)
+
+
+class DateParser:
+    """Parses numeric and named-month dates into ``ParsedDate`` tuples.
+
+    Args:
+        default_calendar: Calendar for numeric dates without an era
+            marker; None infers Hijri for years below ``HIJRI_YEAR_LIMIT``.
+    """
+
+    def __init__(self, default_calendar: Optional[CalendarType] = None,
+                 data: Optional[TranslationData] = None):
+        data = data or TranslationData()
+        self.default_calendar = default_calendar
+        self._months: Dict[str, Tuple[CalendarType, int]] = {}
+        self._exact: Dict[CalendarType, Dict[str, int]] = {c: {} for c in CalendarType}
+        self._add_months(CalendarType.HIJRI, data.HIJRI_MONTHS, data.HIJRI_MONTHS_NUMBERED,
+                         HIJRI_MONTH_VARIANTS)
+        self._add_months(CalendarType.GREGORIAN, data.GREGORIAN_MONTHS,
+                         data.GREGORIAN_MONTHS_NUMBERED, GREGORIAN_MONTH_VARIANTS)
+
+        self._eras: Dict[str, CalendarType] = {}
+        for calendar, markers in ERA_MARKERS.items():
+            names = [data.UI_TEXT[lang][calendar.value] for lang in Language]
+            for marker in (*markers, *names):
+                self._eras[fold(marker)] = calendar
+        self._ignored = {fold(name) for lang in Language
+                         for name in (*data.WEEKDAYS[lang].values(), *data.WEEKDAYS[lang])}
+        self._ignored.update(fold(name[:3]) for name in data.WEEKDAYS[Language.ENGLISH])
+        self._words = lru_cache(maxsize=8192)(self._lookup_words)
+
+    def _add_months(self, calendar: CalendarType, names: Dict[Language, List[str]],
+                    numbered: Dict[Language, List[str]],
+                    variants: Dict[int, Tuple[str, ...]]):
+        """Register every spelling of one calendar's months."""
+        exact = self._exact[calendar]
+        for lang in Language:
+            for month, (name, label) in enumerate(zip(names[lang], numbered[lang]), 1):
+                exact[name] = exact[label] = month
+                self._months[fold_phrase(name)] = (calendar, month)
+        for month, spellings in variants.items():
+            for name in spellings:
+                self._months.setdefault(fold_phrase(name), (calendar, month))
+
+    def month_number(self, name: str, calendar: CalendarType) -> Optional[int]:
+        """Return the month number for a name or dropdown label, or None."""
+        month = self._exact[calendar].get(name)
+        if month is not None:
+            return month
+        found = self._months.get(fold_phrase(name.translate(DIGITS)))
+        return found[1] if found is not None and found[0] is calendar else None
+
+    def parse(self, text: str) -> Optional[ParsedDate]:
+        """Parse one date string; returns None when it is not a date."""
+        text = text.translate(DIGITS)
+        numeric = _NUMERIC.fullmatch(text)
+        if numeric is not None:
+            return self._parse_numeric(*numeric.group(1, 3, 4, 5))
+
+        numbers = _NUMBER.findall(text)
+        if not numbers:
+            return None
+        found = self._words(_NUMBER.sub(" ", text))
+        if found is None:
+            return None
+        month_calendar, month, era = found
+
+        year = day = None
+        loose = []
+        for value, unit in numbers:
+            unit = KOREAN_UNITS.get(unit)
+            if unit == "year":
+                year = int(value)
+            elif unit == "month" and month is None:
+                month = int(value)
+            elif unit == "day":
+                day = int(value)
+            elif unit is None:
+                loose.append(value)
+        for value in loose:
+            if len(value) >= 3 and year is None:
+                year = int(value)
+            elif day is None and len(value) <= 2:
+                day = int(value)
+            else:
+                return None
+        if year is None or month is None:
+            return None
+        if month_calendar is not None and era is not None and month_calendar is not era:
+            return None
+        calendar = month_calendar or era or self._infer_calendar(year)
+        return self._checked(calendar, year, month, day)
+
+    def parse_many(self, texts: Iterable[str]) -> Iterator[Optional[ParsedDate]]:
+        """Lazily parse many strings; unparseable ones yield None."""
+        parse = self.parse
+        for text in texts:
+            yield parse(text)
+
+    def _parse_numeric(self, first: str, month: str, last: str,
+                       tail: str) -> Optional[ParsedDate]:
+        """Handle ``Y-M-D`` / ``D/M/Y`` with an optional era marker."""
+        if len(first) >= 3:
+            year, day = int(first), int(last)
+        elif len(last) >= 3:
+            year, day = int(last), int(first)
+        else:
+            return None
+        era = None
+        if tail.strip():
+            era = self._eras.get(fold_phrase(tail))
+            if era is None:
+                return None
+        return self._checked(era or self._infer_calendar(year), year, int(month), day)
+
+    def _lookup_words(self, words: str) -> Optional[Tuple[Optional[CalendarType],
+                                                          Optional[int],
+                                                          Optional[CalendarType]]]:
+        """Resolve the non-numeric part to (month calendar, month, era); cached."""
+        era = None
+        parts = []
+        for word in _WORD_SPLIT.split(words):
+            key = fold(word)
+            if not key or key in self._ignored:
+                continue
+            marker = self._eras.get(key)
+            if marker is not None and (era is None or era is marker):
+                era = marker
+            else:
+                parts.append(key)
+        if not parts:
+            return None, None, era
+        found = self._months.get("".join(parts))
+        if found is None:
+            return None
+        return found[0], found[1], era
+
+    def _infer_calendar(self, year: int) -> CalendarType:
+        """Calendar for a date with no month name or era marker."""
+        if self.default_calendar is not None:
+            return self.default_calendar
+        return CalendarType.HIJRI if year < HIJRI_YEAR_LIMIT else CalendarType.GREGORIAN
+
+    @staticmethod
+    def _checked(calendar: CalendarType, year: int, month: int,
+                 day: Optional[int]) -> Optional[ParsedDate]:
+        """Reject month and day numbers no calendar has."""
+        max_day = 30 if calendar is CalendarType.HIJRI else 31
+        if not 1 <= month <= 12 or (day is not None and not 1 <= day <= max_day):
+            return None
+        return ParsedDate(calendar, year, month, day)
+
+
+_parser: Optional[DateParser] = None
+
+
+def get_date_parser() -> DateParser:
+    """Return the shared parser, compiling its tables on first use."""
+    global _parser
+    if _parser is None:
+        _parser = DateParser()
+    return _parser
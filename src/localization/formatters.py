@@ -0,0 +1,142 @@
+"""Precompiled localized date formatters.
+
+A ``DateFormatter`` resolves month names, weekday names, digit strings and
+the pattern for one (language, calendar, style) once, so formatting a date
+is a few tuple lookups and one ``str.format`` call.
+
+    >>> get_formatter(Language.ARABIC, CalendarType.HIJRI).format(1445, 9, 1, weekday=0)
+    '1445 الإثنين، 1 رمضان'
+"""
+
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from ..config.settings import CalendarType, Language
+from .translations import WEEKDAY_ORDER, TranslationData
+
+
+ARABIC_INDIC_DIGITS = str.maketrans("0123456789", "٠١٢٣٤٥٦٧٨٩")
+
+# Largest year with a precomputed digit string; larger years are converted per call.
+MAX_CACHED_YEAR = 9999
+
+
+class FormatStyle(Enum):
+    """How much of the date to spell out."""
+    LONG = "long"      # Weekday (when known), day, month name, year
+    MEDIUM = "medium"  # Day, month name, year
+    SHORT = "short"    # Numbers only
+
+
+# Patterns per language and style as (with weekday, without weekday);
+# fields are weekday, day, month and year.
+PATTERNS: Dict[Language, Dict[FormatStyle, Tuple[str, str]]] = {
+    Language.ARABIC: {
+        FormatStyle.LONG: ("{3} {0}، {1} {2}", "{1} {2} {3}"),
+        FormatStyle.MEDIUM: ("{1} {2} {3}", "{1} {2} {3}"),
+        FormatStyle.SHORT: ("{1}/{2}/{3}", "{1}/{2}/{3}"),
+    },
+    Language.ENGLISH: {
+        FormatStyle.LONG: ("{0}, {1} {2} {3}", "{1} {2} {3}"),
+        FormatStyle.MEDIUM: ("{1} {2} {3}", "{1} {2} {3}"),
+        FormatStyle.SHORT: ("{1}/{2}/{3}", "{1}/{2}/{3}"),
+    },
+    Language.KOREAN: {
+        FormatStyle.LONG: ("{0}, {3}년 {2} {1}일", "{3}년 {2} {1}일"),
+        FormatStyle.MEDIUM: ("{3}년 {2} {1}일", "{3}년 {2} {1}일"),
+        FormatStyle.SHORT: ("{3}/{2}/{1}", "{3}/{2}/{1}"),
+    },
+}
+
+_WEEKDAY_INDEX: Dict[str, int] = {name: i for i, name in enumerate(WEEKDAY_ORDER)}
+
+
+def weekday_index(english_name: str) -> Optional[int]:
+    """Return the Monday=0 index of an English weekday name, or None."""
+    return _WEEKDAY_INDEX.get(english_name)
+
+
+@lru_cache(maxsize=2)
+def _numbers(arabic_digits: bool) -> Tuple[str, ...]:
+    """Digit strings for 0..MAX_CACHED_YEAR in the requested digit system."""
+    numbers = tuple(str(n) for n in range(MAX_CACHED_YEAR + 1))
+    if arabic_digits:
+        numbers = tuple(n.translate(ARABIC_INDIC_DIGITS) for n in numbers)
+    return numbers
+
+
+class DateFormatter:
+    """Formats dates of one calendar in one language and style.
+
+    Args:
+        language: Output language.
+        calendar: Calendar the formatted dates belong to; selects month names.
+        style: Amount of detail (see ``FormatStyle``).
+        arabic_digits: Write numbers with Arabic-Indic digits.
+    """
+
+    def __init__(self, language: Language, calendar: CalendarType,
+                 style: FormatStyle = FormatStyle.LONG, arabic_digits: bool = False,
+                 data: Optional[TranslationData] = None):
+        data = data or TranslationData()
+        self.language = language
+        self.calendar = calendar
+        self.style = style
+        self.arabic_digits = arabic_digits
+
+        numbers = _numbers(arabic_digits)
+        self._numbers = numbers
+        self._digits = ARABIC_INDIC_DIGITS if arabic_digits else None
+        if style is FormatStyle.SHORT:
+            self._months = ("",) + numbers[1:13]
+        else:
+            names = (data.HIJRI_MONTHS if calendar is CalendarType.HIJRI
+                     else data.GREGORIAN_MONTHS)[language]
+            self._months = ("",) + tuple(names)
+        translated = data.WEEKDAYS[language]
+        self._weekdays = tuple(translated[name] for name in WEEKDAY_ORDER)
+        with_weekday, without_weekday = PATTERNS[language][style]
+        self._with_weekday = with_weekday.format
+        self._without_weekday = without_weekday.format
+
+    def format(self, year: int, month: int, day: int, weekday: Optional[int] = None) -> str:
+        """Format one date; ``weekday`` is a Monday=0 index or None."""
+        numbers = self._numbers
+        year_text = (numbers[year] if 0 <= year <= MAX_CACHED_YEAR
+                     else self._number(year))
+        if weekday is None or weekday < 0:
+            return self._without_weekday(None, numbers[day], self._months[month], year_text)
+        return self._with_weekday(self._weekdays[weekday], numbers[day],
+                                  self._months[month], year_text)
+
+    def format_result(self, result: Any, weekday: Optional[int] = None) -> str:
+        """Format a ``DateResult`` or ``CompactDateResult``.
+
+        ``weekday`` overrides the result's own weekday, e.g. to show the
+        Gregorian weekday next to a Hijri date.
+        """
+        if weekday is None:
+            weekday = getattr(result, "weekday_index", None)
+            if weekday is None:
+                weekday = _WEEKDAY_INDEX.get(result.weekday)
+        return self.format(result.year, result.month, result.day, weekday)
+
+    def format_many(self, results: Iterable[Any]) -> Iterator[Optional[str]]:
+        """Lazily format results; None entries (failed rows) stay None."""
+        format_result = self.format_result
+        for result in results:
+            yield None if result is None else format_result(result)
+
+    def _number(self, value: int) -> str:
+        """Digit string for a number outside the precomputed range."""
+        text = str(value)
+        return text.translate(self._digits) if self._digits is not None else text
+
+
+@lru_cache(maxsize=None)
+def get_formatter(language: Language, calendar: CalendarType,
+                  style: FormatStyle = FormatStyle.LONG,
+                  arabic_digits: bool = False) -> DateFormatter:
+    """Return the shared formatter for a (language, calendar, style, digits) combination."""
+    return DateFormatter(language, calendar, style, arabic_digits)
@@ -0,0 +1,137 @@
+"""Multi-process conversion of large CSV files.
+
+The input is split into byte ranges that end on line boundaries, each
+range is converted by a worker process with ``text_io.convert_stream``, and
+the converted ranges are written out in input order.
+
+Quoted CSV fields containing newlines are not supported, since ranges are
+cut at raw newlines.
+"""
+
+from collections import defaultdict
+from multiprocessing import Pool
+from typing import Dict, List, Optional, TextIO, Tuple
+import io
+import os
+import sys
+import time
+
+from .config.settings import CalendarType
+from .core.calendar_converter import (
+    CalendarConverter, ErrorPolicy, HijriGregorianConverter, KuwaitiCalendarConverter,
+)
+from .core.text_io import convert_stream
+
+
+ALGORITHMS = ("ummalqura", "kuwaiti")
+
+
+def split_ranges(path: str, chunk_bytes: int) -> Tuple[bytes, List[Tuple[int, int]]]:
+    """Return the header line and (start, end) byte ranges of the data lines.
+
+    Every range ends just after a newline (or at end of file), so no line is
+    split between two ranges.
+    """
+    size = os.path.getsize(path)
+    ranges = []
+    with open(path, 'rb') as f:
+        header = f.readline()
+        start = f.tell()
+        while start < size:
+            f.seek(min(start + chunk_bytes, size))
+            if f.tell() < size:
+                f.readline()
+            end = f.tell()
+            ranges.append((start, end))
+            start = end
+    return header, ranges
+
+
+_worker_converter: Optional[CalendarConverter] = None
+
+
+def _init_worker(algorithm: str, table_path: Optional[str]):
+    """Build the per-process converter once."""
+    global _worker_converter
+    if algorithm == "kuwaiti":
+        _worker_converter = KuwaitiCalendarConverter(true_jdn=True)
+    else:
+        _worker_converter = HijriGregorianConverter(use_index=table_path is None,
+                                                    table_path=table_path)
+
+
+def _convert_range(task) -> Tuple[int, str, int, int, float, int]:
+    """Convert one byte range; returns (position, output, rows, failed, seconds, pid)."""
+    position, path, start, end, header, options = task
+    began = time.perf_counter()
+    with open(path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    infile = io.StringIO((header + data).decode('utf-8'), newline='')
+    outfile = io.StringIO(newline='')
+    rows, failed = convert_stream(infile, outfile, converter=_worker_converter, **options)
+    text = outfile.getvalue()
+    body = text[text.index('\n') + 1:]  # drop the repeated header
+    return (position, body, rows, failed,
+            time.perf_counter() - began, os.getpid())
+
+
+def convert_file_parallel(path: str, outfile: TextIO, column: str,
+                          target: CalendarType, workers: Optional[int] = None,
+                          chunk_bytes: int = 16 * 2**20,
+                          algorithm: str = "ummalqura",
+                          table_path: Optional[str] = None,
+                          out_column: Optional[str] = None,
+                          on_error: ErrorPolicy = ErrorPolicy.SENTINEL,
+                          delimiter: str = ',',
+                          progress: Optional[TextIO] = sys.stderr) -> Tuple[int, int]:
+    """Convert a CSV date column using a pool of worker processes.
+
+    Args:
+        path: Input CSV file; must be a seekable file, not a pipe.
+        outfile: Text stream receiving the converted CSV in input order.
+        column: Name of the date column.
+        target: Calendar to convert into.
+        workers: Number of processes (default: CPU count).
+        chunk_bytes: Approximate size of each byte range.
+        algorithm: ``"ummalqura"`` or ``"kuwaiti"`` (Hijri target only).
+        table_path: Precompiled calendar table mapped by each worker.
+        progress: Stream for per-worker progress lines, or None.
+
+    Returns:
+        (rows written, rows that failed to convert)
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm {algorithm!r}; expected one of {ALGORITHMS}")
+    if algorithm == "kuwaiti" and target is not CalendarType.HIJRI:
+        raise ValueError("The Kuwaiti algorithm only converts Gregorian to Hijri")
+
+    header, ranges = split_ranges(path, chunk_bytes)
+    header_text = header.decode('utf-8')
+    options = dict(column=column, target=target, out_column=out_column,
+                   on_error=on_error, delimiter=delimiter)
+
+    # Write the output header with the same writer settings as the workers.
+    head_out = io.StringIO(newline='')
+    convert_stream(io.StringIO(header_text, newline=''), head_out, **options,
+                   converter=HijriGregorianConverter())
+    outfile.write(head_out.getvalue())
+
+    tasks = ((i, path, start, end, header, options) for i, (start, end) in enumerate(ranges))
+    stats: Dict[int, List[float]] = defaultdict(lambda: [0, 0, 0.0])
+    written = failed = 0
+    with Pool(workers, initializer=_init_worker, initargs=(algorithm, table_path)) as pool:
+        # imap yields results in task order, so output order matches input.
+        for position, body, rows, bad, seconds, pid in pool.imap(_convert_range, tasks):
+            outfile.write(body)
+            written += rows
+            failed += bad
+            worker = stats[pid]
+            worker[0] += 1
+            worker[1] += rows
+            worker[2] += seconds
+            if progress is not None:
+                print(f"[{position + 1}/{len(ranges)}] worker {pid}: "
+                      f"{worker[0]} chunks, {worker[1]} rows, "
+                      f"{worker[1] / worker[2]:,.0f} rows/sec", file=progress)
+    return written, failed
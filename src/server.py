@@ -0,0 +1,267 @@
+"""Asyncio HTTP/1.1 conversion service.
+
+Standard library only. Endpoints:
+
+    GET  /health           -> {"status": "ok"}
+    POST /convert          {"date": "2024-03-11", "to": "hijri"}
+    POST /convert/batch    {"dates": ["2024-03-11", ...], "to": "hijri"}
+
+Dates are ``YYYY-MM-DD`` or ``DD/MM/YYYY``. Connections are kept alive
+(HTTP/1.1 semantics), bodies above ``max_body`` are rejected with 413,
+and batches larger than ``inline_limit`` are converted in an executor so
+the event loop keeps serving other requests.
+
+Run with:
+    hijri-converter serve --port 8080
+"""
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import json
+import logging
+
+from .config.settings import CalendarType
+from .core.calendar_converter import ErrorPolicy, HijriGregorianConverter
+from .core.text_io import format_date, parse_date
+
+
+logger = logging.getLogger(__name__)
+
+MAX_HEADER_BYTES = 16 * 1024
+
+_converter: Optional[HijriGregorianConverter] = None
+
+
+class HTTPError(Exception):
+    """Error answered with an HTTP status and a JSON message."""
+
+    def __init__(self, status: HTTPStatus, message: str, close: bool = False):
+        super().__init__(message)
+        self.status = status
+        self.close = close
+
+
+def _get_converter() -> HijriGregorianConverter:
+    """Return this process's converter, creating it on first use."""
+    global _converter
+    if _converter is None:
+        _converter = HijriGregorianConverter(use_index=True)
+    return _converter
+
+
+def convert_dates(target: str, dates: List[str]) -> Tuple[List[Optional[dict]], int]:
+    """Convert date strings; returns (results with None for failures, failures)."""
+    converter = _get_converter()
+    convert_many = (converter.to_hijri_many if target == CalendarType.HIJRI.value
+                    else converter.to_gregorian_many)
+    parsed = [parse_date(d) if isinstance(d, str) else None for d in dates]
+    results = []
+    failed = 0
+    for result in convert_many(parsed, on_error=ErrorPolicy.SENTINEL):
+        if result is None:
+            failed += 1
+            results.append(None)
+        else:
+            results.append({
+                "date": format_date(result),
+                "year": result.year,
+                "month": result.month,
+                "day": result.day,
+                "weekday": result.weekday,
+            })
+    return results, failed
+
+
+class ConversionServer:
+    """HTTP server answering conversion requests.
+
+    Args:
+        host: Interface to bind.
+        port: TCP port; 0 picks a free one.
+        max_body: Largest accepted request body in bytes.
+        inline_limit: Batches above this size run in the executor.
+        executor: ``"thread"`` or ``"process"`` pool for large batches.
+        workers: Executor size (default: the executor's own default).
+        keepalive_timeout: Seconds an idle connection stays open.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8080,
+                 max_body: int = 1024 * 1024, inline_limit: int = 256,
+                 executor: str = "thread", workers: Optional[int] = None,
+                 keepalive_timeout: float = 15.0):
+        self.host = host
+        self.port = port
+        self.max_body = max_body
+        self.inline_limit = inline_limit
+        self.keepalive_timeout = keepalive_timeout
+        self._executor_kind = executor
+        self._workers = workers
+        self._executor: Optional[Executor] = None
+        self._server: Optional[asyncio.base_events.Server] = None
+
+    async def start(self):
+        """Start listening; ``port`` is updated if 0 was requested."""
+        if self._executor_kind == "process":
+            self._executor = ProcessPoolExecutor(self._workers)
+        else:
+            self._executor = ThreadPoolExecutor(self._workers)
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"Serving on http://{self.host}:{self.port}")
+
+    async def serve_forever(self):
+        """Start if needed and serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self):
+        """Stop listening and shut the executor down."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve requests on one connection until it closes."""
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(self._read_request(reader),
+                                                     self.keepalive_timeout)
+                except asyncio.TimeoutError:
+                    break
+                if request is None:
+                    break
+                method, path, headers, body, keep_alive = request
+                try:
+                    status, payload = await self._dispatch(method, path, body)
+                except HTTPError as e:
+                    status, payload = e.status, {"error": str(e)}
+                    keep_alive = keep_alive and not e.close
+                self._write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except HTTPError as e:
+            self._write_response(writer, e.status, {"error": str(e)}, False)
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader):
+        """Read one request; returns None when the peer closed the connection."""
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError as e:
+            if not e.partial:
+                return None
+            raise
+        except asyncio.LimitOverrunError:
+            raise HTTPError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE,
+                            "Request headers too large", close=True)
+        if len(head) > MAX_HEADER_BYTES:
+            raise HTTPError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE,
+                            "Request headers too large", close=True)
+
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, path, version = lines[0].split(" ")
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Malformed request line", close=True)
+        headers: Dict[str, str] = {}
+        for line in lines[1:]:
+            if line:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+        connection = headers.get("connection", "").lower()
+        if version == "HTTP/1.1":
+            keep_alive = connection != "close"
+        else:
+            keep_alive = connection == "keep-alive"
+
+        if "transfer-encoding" in headers:
+            raise HTTPError(HTTPStatus.NOT_IMPLEMENTED,
+                            "Chunked request bodies are not supported", close=True)
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length", close=True)
+        if length < 0:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length", close=True)
+        if length > self.max_body:
+            raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                            f"Body exceeds {self.max_body} bytes", close=True)
+        body = await reader.readexactly(length) if length else b""
+        return method, path, headers, body, keep_alive
+
+    async def _dispatch(self, method: str, path: str, body: bytes):
+        """Route a request and return (status, JSON payload)."""
+        path = path.split("?", 1)[0]
+        if path == "/health":
+            if method != "GET":
+                raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, "Use GET")
+            return HTTPStatus.OK, {"status": "ok"}
+        if path not in ("/convert", "/convert/batch"):
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"No route for {path}")
+        if method != "POST":
+            raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, "Use POST")
+
+        try:
+            request = json.loads(body)
+        except (ValueError, UnicodeDecodeError):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Body must be JSON")
+        if not isinstance(request, dict):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Body must be a JSON object")
+        target = request.get("to")
+        if target not in (CalendarType.HIJRI.value, CalendarType.GREGORIAN.value):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "'to' must be 'hijri' or 'gregorian'")
+
+        if path == "/convert":
+            results, failed = convert_dates(target, [request.get("date")])
+            if failed:
+                raise HTTPError(HTTPStatus.UNPROCESSABLE_ENTITY,
+                                f"Cannot convert {request.get('date')!r}")
+            return HTTPStatus.OK, results[0]
+
+        dates = request.get("dates")
+        if not isinstance(dates, list):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "'dates' must be a list")
+        if len(dates) > self.inline_limit:
+            loop = asyncio.get_running_loop()
+            results, failed = await loop.run_in_executor(
+                self._executor, convert_dates, target, dates)
+        else:
+            results, failed = convert_dates(target, dates)
+        return HTTPStatus.OK, {"results": results, "failed": failed}
+
+    @staticmethod
+    def _write_response(writer: asyncio.StreamWriter, status: HTTPStatus,
+                        payload: dict, keep_alive: bool):
+        """Write a JSON response."""
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = (f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                f"Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode("latin-1") + body)
+
+
+def run(host: str = "127.0.0.1", port: int = 8080, **options):
+    """Run the server until interrupted."""
+    server = ConversionServer(host, port, **options)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
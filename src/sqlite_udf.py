@@ -0,0 +1,153 @@
+"""Hijri conversion inside SQLite.
+
+``register_functions`` adds deterministic SQL functions to a connection:
+
+    hijri_year(date), hijri_month(date), hijri_day(date)
+    to_gregorian(hijri_date) or to_gregorian(year, month, day)
+
+``date`` is ``YYYY-MM-DD`` text (a time part is ignored), ``DD/MM/YYYY``,
+or a Julian day number such as ``julianday(col)``. ``to_gregorian``
+returns ``YYYY-MM-DD`` text. Anything that cannot be converted gives NULL.
+
+For large joins, ``create_calendar_dim`` writes an indexed ``calendar_dim``
+table instead, so reports can join on ``date`` rather than call a function
+per row:
+
+    SELECT d.hijri_year, d.hijri_month, SUM(s.amount)
+    FROM sales s JOIN calendar_dim d ON d.date = s.sold_on
+    GROUP BY 1, 2
+"""
+
+from datetime import date
+from typing import Any, Iterator, Optional, Tuple
+import re
+import sqlite3
+
+from .calendar_dim import iter_days
+from .core.cache import ConversionCache
+from .core.calendar_converter import HijriGregorianConverter
+from .core.calendars import ORDINAL_TO_JDN
+from .core.text_io import format_date, parse_date
+from .core.month_index import MonthStartIndex
+
+
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+def _gregorian_tuple(value: Any) -> Optional[Tuple[int, int, int]]:
+    """Return (day, month, year) for a date text or Julian day number."""
+    if isinstance(value, (int, float)):
+        try:
+            gregorian = date.fromordinal(int(value + 0.5) - ORDINAL_TO_JDN)
+        except (ValueError, OverflowError):
+            return None
+        return gregorian.day, gregorian.month, gregorian.year
+    if isinstance(value, str):
+        if len(value) > 10 and value[10] in " T":
+            value = value[:10]
+        return parse_date(value)
+    return None
+
+
+def register_functions(conn: sqlite3.Connection,
+                       converter: Optional[HijriGregorianConverter] = None,
+                       cache_size: int = 65536):
+    """Register the Hijri SQL functions on ``conn``.
+
+    Args:
+        conn: Connection to register on.
+        converter: Converter to use (default: index-backed).
+        cache_size: Entries kept per direction in the result caches.
+    """
+    converter = converter if converter is not None else HijriGregorianConverter(use_index=True)
+    hijri_cache = ConversionCache(cache_size)
+    gregorian_cache = ConversionCache(cache_size)
+
+    def hijri(value: Any) -> Optional[Tuple[int, int, int]]:
+        def compute():
+            parsed = _gregorian_tuple(value)
+            if parsed is None:
+                return None
+            try:
+                result = converter._to_hijri_row(*parsed)
+            except (ValueError, TypeError, OverflowError):
+                return None
+            return result.year, result.month, result.day
+        return None if value is None else hijri_cache.get_or_compute(value, compute)
+
+    def to_gregorian(*args: Any) -> Optional[str]:
+        def compute():
+            if len(args) == 1:
+                parsed = parse_date(args[0]) if isinstance(args[0], str) else None
+            else:
+                year, month, day = args
+                parsed = (day, month, year) if all(isinstance(a, int) for a in args) else None
+            if parsed is None:
+                return None
+            try:
+                return format_date(converter._to_gregorian_row(*parsed))
+            except (ValueError, TypeError, OverflowError):
+                return None
+        return None if None in args else gregorian_cache.get_or_compute(args, compute)
+
+    def field(position: int):
+        def function(value: Any) -> Optional[int]:
+            result = hijri(value)
+            return None if result is None else result[position]
+        return function
+
+    conn.create_function("hijri_year", 1, field(0), deterministic=True)
+    conn.create_function("hijri_month", 1, field(1), deterministic=True)
+    conn.create_function("hijri_day", 1, field(2), deterministic=True)
+    conn.create_function("to_gregorian", 1, to_gregorian, deterministic=True)
+    conn.create_function("to_gregorian", 3, to_gregorian, deterministic=True)
+
+
+def calendar_rows(start: date, end: date,
+                  index: Optional[MonthStartIndex] = None) -> Iterator[tuple]:
+    """Yield one ``calendar_dim`` row per day from ``start`` to ``end``.
+
+    Days outside the supported Hijri range get NULL Hijri columns.
+    """
+    for gregorian, weekday, hijri, month_length in iter_days(start, end, index):
+        h_year, h_month, h_day = hijri if hijri is not None else (None, None, None)
+        yield (gregorian.isoformat(), gregorian.year, gregorian.month, gregorian.day,
+               weekday, h_year, h_month, h_day, month_length)
+
+
+def create_calendar_dim(conn: sqlite3.Connection, start: date, end: date,
+                        table: str = "calendar_dim", replace: bool = False) -> int:
+    """Create and fill an indexed calendar dimension table.
+
+    Columns: ``date`` (ISO text, primary key), ``year``, ``month``, ``day``,
+    ``weekday`` (0 is Monday), ``hijri_year``, ``hijri_month``,
+    ``hijri_day`` and ``hijri_month_length``.
+
+    Returns:
+        Number of rows inserted.
+    """
+    if not _IDENTIFIER.fullmatch(table):
+        raise ValueError(f"Invalid table name: {table!r}")
+    if end < start:
+        raise ValueError(f"End date {end} is before start date {start}")
+    with conn:
+        if replace:
+            conn.execute(f"DROP TABLE IF EXISTS {table}")
+        conn.execute(f"""
+            CREATE TABLE {table} (
+                date TEXT PRIMARY KEY,
+                year INTEGER NOT NULL,
+                month INTEGER NOT NULL,
+                day INTEGER NOT NULL,
+                weekday INTEGER NOT NULL,
+                hijri_year INTEGER,
+                hijri_month INTEGER,
+                hijri_day INTEGER,
+                hijri_month_length INTEGER
+            )""")
+        cursor = conn.executemany(f"INSERT INTO {table} VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                  calendar_rows(start, end))
+        conn.execute(f"CREATE UNIQUE INDEX {table}_hijri ON {table} "
+                     f"(hijri_year, hijri_month, hijri_day)")
+        conn.execute(f"CREATE INDEX {table}_year_month ON {table} (year, month)")
+    return cursor.rowcount
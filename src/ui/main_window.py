@@ -2,19 +2,34 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import pyglet
 import os
 import sys
 import logging
-from typing import Optional
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, NamedTuple, Optional, Sequence
 
 from ..config.settings import config, Language, CalendarType
 from ..core.calendar_converter import HijriGregorianConverter, DateResult
+from ..core.validation import OutOfRangeError
+from ..localization.formatters import get_formatter, weekday_index
 from ..localization.translations import Translator
+from ..utils.timing import StartupTimer
 
 
 logger = logging.getLogger(__name__)
 
+# How often the UI thread checks whether background resources are ready
+RESOURCE_POLL_MS = 50
+
+
+class PreloadedResources(NamedTuple):
+    """Outcome of ``ResourceManager.preload``."""
+    fonts: Dict[str, bool]
+    images: Dict[str, Optional[bytes]]
+    seconds: float
+
 
 class ResourceManager:
     """Manages application resources like fonts and images."""
@@ -22,6 +37,7 @@ class ResourceManager:
     def __init__(self):
         self._resource_base = self._get_resource_base()
         self._loaded_fonts = set()
+        self._lock = threading.Lock()
     
     def _get_resource_base(self) -> str:
         """Get the base path for resources."""
@@ -38,35 +54,78 @@ class ResourceManager:
     
     def load_font(self, font_path: str) -> bool:
         """Load a font file."""
-        if font_path not in self._loaded_fonts:
-            try:
-                full_path = self.get_resource_path(font_path)
-                pyglet.font.add_file(full_path)
-                self._loaded_fonts.add(font_path)
-                logger.info(f"Loaded font: {font_path}")
+        with self._lock:
+            if font_path in self._loaded_fonts:
                 return True
+        try:
+            import pyglet  # Only the GUI needs it, and only to register fonts
+            full_path = self.get_resource_path(font_path)
+            pyglet.font.add_file(full_path)
+            with self._lock:
+                self._loaded_fonts.add(font_path)
+            logger.info(f"Loaded font: {font_path}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to load font {font_path}: {e}")
+            return False
+    
+    def read_image(self, image_path: str) -> Optional[bytes]:
+        """Read an image file; the Tk image itself must be built on the UI thread."""
+        try:
+            with open(self.get_resource_path(image_path), 'rb') as f:
+                return f.read()
+        except OSError as e:
+            logger.warning(f"Could not read image {image_path}: {e}")
+            return None
+    
+    def preload(self, font_paths: Sequence[str],
+                image_paths: Sequence[str] = ()) -> "Future[PreloadedResources]":
+        """Load fonts and read images concurrently in a background thread.
+        
+        Returns immediately; the future resolves once every file is done,
+        or holds the exception if the loading thread itself failed.
+        """
+        result: "Future[PreloadedResources]" = Future()
+        
+        def run():
+            try:
+                started = time.perf_counter()
+                workers = max(1, len(font_paths) + len(image_paths))
+                with ThreadPoolExecutor(workers, thread_name_prefix="resource") as pool:
+                    fonts = {path: pool.submit(self.load_font, path) for path in font_paths}
+                    images = {path: pool.submit(self.read_image, path) for path in image_paths}
+                result.set_result(PreloadedResources(
+                    {path: future.result() for path, future in fonts.items()},
+                    {path: future.result() for path, future in images.items()},
+                    time.perf_counter() - started,
+                ))
             except Exception as e:
-                logger.error(f"Failed to load font {font_path}: {e}")
-                return False
-        return True
+                result.set_exception(e)
+        
+        threading.Thread(target=run, name="resource-preload", daemon=True).start()
+        return result
 
 
 class DateConverterUI:
     """Main application UI."""
     
-    def __init__(self):
+    def __init__(self, timer: Optional[StartupTimer] = None):
+        self.timer = timer or StartupTimer()
         self.resource_manager = ResourceManager()
-        self.translator = Translator()
-        self.converter = HijriGregorianConverter()
         
-        # Load fonts
-        self.resource_manager.load_font(
-            config.get_font_path(config.paths.arabic_font)
-        )
-        self.resource_manager.load_font(
-            config.get_font_path(config.paths.latin_font)
+        # Fonts and the logo load in the background while the window is built;
+        # widgets use the system fallback until _poll_resources swaps them in
+        self._logo_path = config.get_image_path(config.paths.logo_file)
+        self._preload_started = time.perf_counter()
+        self._resources = self.resource_manager.preload(
+            [config.get_font_path(config.paths.arabic_font),
+             config.get_font_path(config.paths.latin_font)],
+            [self._logo_path],
         )
         
+        self.translator = Translator()
+        self.converter = HijriGregorianConverter()
+        
         # Initialize UI
         self._setup_window()
         self._create_widgets()
@@ -74,6 +133,10 @@ class DateConverterUI:
         
         # Set default language
         self.set_language(Language.ARABIC)
+        self.timer.mark("widgets")
+        
+        self.root.after_idle(self._on_first_paint)
+        self._poll_resources()
     
     def _setup_window(self):
         """Setup the main window."""
@@ -161,15 +224,9 @@ class DateConverterUI:
         # Bottom frame with logo and info
         self.bottom_frame = tk.Frame(self.root, background=config.ui.background_color)
         
-        try:
-            logo_path = self.resource_manager.get_resource_path(
-                config.get_image_path(config.paths.logo_file)
-            )
-            self.logo = tk.PhotoImage(file=logo_path)
-            self.logo_label = tk.Label(self.bottom_frame, image=self.logo)
-        except Exception as e:
-            logger.warning(f"Could not load logo: {e}")
-            self.logo_label = None
+        # Image is set once the logo has been read in the background
+        self.logo = None
+        self.logo_label = tk.Label(self.bottom_frame)
         
         self.info_button = tk.Button(self.bottom_frame, command=self._show_info)
     
@@ -198,10 +255,48 @@ class DateConverterUI:
         
         # Bottom frame
         self.bottom_frame.pack(side=tk.BOTTOM, fill=tk.X, ipadx=10, ipady=10)
-        if self.logo_label:
-            self.logo_label.pack(side="right", anchor=tk.SE, pady=10, padx=10)
         self.info_button.pack(side="left", anchor=tk.SW, pady=10, padx=10)
     
+    def _on_first_paint(self):
+        """Record the first paint; runs after Tk's pending redraws."""
+        self.timer.mark("first paint")
+        self._report_startup()
+    
+    def _poll_resources(self):
+        """Apply background resources once ready; Tk may only be used on this thread."""
+        if not self._resources.done():
+            self.root.after(RESOURCE_POLL_MS, self._poll_resources)
+            return
+        error = self._resources.exception()
+        if error is not None:
+            logger.warning(f"Background resource loading failed; using system fonts: {error}")
+            self.timer.record("fonts", time.perf_counter() - self._preload_started)
+            self._report_startup()
+            return
+        resources = self._resources.result()
+        
+        logo = resources.images.get(self._logo_path)
+        if logo is not None:
+            try:
+                self.logo = tk.PhotoImage(data=logo)
+                self.logo_label.config(image=self.logo)
+                self.logo_label.pack(side="right", anchor=tk.SE, pady=10, padx=10)
+            except tk.TclError as e:
+                logger.warning(f"Could not load logo: {e}")
+        
+        # Re-applying the font tuples makes Tk resolve the newly added families
+        if any(resources.fonts.values()):
+            self._update_ui_text()
+            self._update_fonts()
+        
+        self.timer.record("fonts", resources.seconds)
+        self._report_startup()
+    
+    def _report_startup(self):
+        """Log the startup report once both the first paint and fonts are done."""
+        if self.timer.has("first paint", "fonts"):
+            self.timer.report(background=("fonts",))
+    
     def _on_calendar_change(self):
         """Handle calendar type change."""
         self._update_date_inputs()
@@ -272,12 +367,10 @@ class DateConverterUI:
             day = int(self.day_dropdown.get())
             
             # Get month index
-            if self.selected_calendar.get() == CalendarType.HIJRI.value:
-                months = self.translator.get_hijri_months(numbered=True)
-            else:
-                months = self.translator.get_gregorian_months(numbered=True)
-            
-            month = months.index(month_name) + 1
+            calendar = CalendarType(self.selected_calendar.get())
+            month = self.translator.get_month_number(month_name, calendar)
+            if month is None:
+                raise ValueError(f"Unknown month: {month_name!r}")
             
             # Perform conversion
             if self.selected_calendar.get() == CalendarType.GREGORIAN.value:
@@ -289,6 +382,13 @@ class DateConverterUI:
                 gregorian_result = self.converter.to_gregorian(day, month, year)
                 self._display_results(gregorian_result, hijri_result)
                 
+        except OutOfRangeError as e:
+            messagebox.showerror(
+                self.translator.get_text('error'),
+                self.translator.get_text('error_out_of_range').format(first=e.first,
+                                                                      last=e.last)
+            )
+            logger.warning(f"Conversion error: {e}")
         except (ValueError, IndexError) as e:
             messagebox.showerror(
                 self.translator.get_text('error'),
@@ -298,20 +398,15 @@ class DateConverterUI:
     
     def _display_results(self, gregorian: DateResult, hijri: DateResult):
         """Display conversion results."""
-        # Format dates with proper month names
-        gregorian_month = self.translator.get_gregorian_month(gregorian.month)
-        hijri_month = self.translator.get_hijri_month(hijri.month)
-        weekday = self.translator.get_weekday(gregorian.weekday)
-        
-        if self.translator.language == Language.ARABIC:
-            result_text = f"{self.translator.get_text('hijri_date')}\n{self.translator.get_text('gregorian_date')}"
-            detail_text = f"{hijri.year} {weekday}، {hijri.day} {hijri_month}\n{gregorian.year} {weekday}، {gregorian.day} {gregorian_month}"
-        elif self.translator.language == Language.KOREAN:
-            result_text = f"{self.translator.get_text('hijri_date')}\n{self.translator.get_text('gregorian_date')}"
-            detail_text = f"{weekday}, {hijri.year}년 {hijri_month} {hijri.day}일\n{weekday}, {gregorian.year}년 {gregorian_month} {gregorian.day}일"
-        else:
-            result_text = f"{self.translator.get_text('hijri_date')}\n{self.translator.get_text('gregorian_date')}"
-            detail_text = f"{weekday}, {hijri.day} {hijri_month} {hijri.year}\n{weekday}, {gregorian.day} {gregorian_month} {gregorian.year}"
+        # Both lines show the Gregorian weekday
+        language = self.translator.language
+        weekday = weekday_index(gregorian.weekday)
+        hijri_text = get_formatter(language, CalendarType.HIJRI).format_result(hijri, weekday)
+        gregorian_text = get_formatter(language, CalendarType.GREGORIAN).format_result(
+            gregorian, weekday)
+        
+        result_text = f"{self.translator.get_text('hijri_date')}\n{self.translator.get_text('gregorian_date')}"
+        detail_text = f"{hijri_text}\n{gregorian_text}"
         
         self.result_label.config(text=result_text)
         self.result_detail_label.config(text=detail_text)
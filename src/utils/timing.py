@@ -0,0 +1,60 @@
+"""Startup phase timing."""
+
+import logging
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTimer:
+    """Records how long each startup phase took and logs one report.
+
+    Phases measured on the main thread are closed with ``mark``; work done
+    elsewhere (e.g. background font loading) is added with ``record``.
+
+    Args:
+        started: ``time.perf_counter()`` value when startup began.
+    """
+
+    def __init__(self, started: Optional[float] = None):
+        self.started = started if started is not None else time.perf_counter()
+        self._last = self.started
+        self._phases: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._reported = False
+
+    def mark(self, phase: str) -> float:
+        """Close ``phase`` at the current time; returns its duration in seconds."""
+        now = time.perf_counter()
+        with self._lock:
+            seconds = now - self._last
+            self._last = now
+            self._phases[phase] = seconds
+        return seconds
+
+    def record(self, phase: str, seconds: float):
+        """Add a phase measured elsewhere, e.g. in a background thread."""
+        with self._lock:
+            self._phases[phase] = seconds
+
+    def has(self, *phases: str) -> bool:
+        """Whether every named phase has been recorded."""
+        with self._lock:
+            return all(phase in self._phases for phase in phases)
+
+    def report(self, background: Iterable[str] = ()) -> str:
+        """Log the phases and total once; later calls only return the text."""
+        background = set(background)
+        with self._lock:
+            parts = [f"{phase} {seconds * 1000:.1f} ms"
+                     + (" (background)" if phase in background else "")
+                     for phase, seconds in self._phases.items()]
+            total = self._last - self.started
+            reported, self._reported = self._reported, True
+        text = f"Startup: {', '.join(parts)}; ready after {total * 1000:.1f} ms"
+        if not reported:
+            logger.info(text)
+        return text